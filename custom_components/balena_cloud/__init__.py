@@ -11,6 +11,8 @@ from homeassistant.helpers import device_registry as dr
 
 from .const import DOMAIN
 from .coordinator import BalenaCloudDataUpdateCoordinator
+from .services import (async_remove_services, async_setup_services,
+                       get_service_handler)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +32,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create and store coordinator
     coordinator = BalenaCloudDataUpdateCoordinator(
-        hass, entry, dict(entry.data), dict(entry.options)
+        hass, entry, entry.data, entry.options
     )
 
     # Perform initial data fetch
@@ -42,9 +44,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Setup services
-    from .services import async_setup_services
-
     await async_setup_services(hass)
+    get_service_handler(hass).register_coordinator(entry.entry_id, coordinator)
 
     _LOGGER.info("Balena Cloud integration setup completed")
     return True
@@ -63,6 +64,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        get_service_handler(hass).unregister_coordinator(entry.entry_id)
+        await async_remove_services(hass)
 
     _LOGGER.info("Balena Cloud integration unloaded")
     return unload_ok
@@ -70,8 +73,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    hass.config_entries.async_schedule_reload(entry.entry_id)
 
 
 async def async_remove_config_entry_device(
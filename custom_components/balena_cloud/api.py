@@ -351,6 +351,21 @@ class BalenaCloudAPIClient:
             _LOGGER.error("Failed to restart application on %s: %s", device_uuid, err)
             return False
 
+    @async_retry()
+    async def async_restart_fleet(self, fleet_id: int) -> bool:
+        """Restart the application on all devices in a fleet."""
+        try:
+            await self._run_in_executor("models.application.restart", fleet_id)
+            return True
+        except balena_exceptions.ApplicationNotFound:
+            _LOGGER.warning("Fleet with ID %s not found", fleet_id)
+            return False
+        except balena_exceptions.MalformedToken as err:
+            raise BalenaCloudAuthenticationError(ERROR_AUTH_FAILED) from err
+        except Exception as err:
+            _LOGGER.error("Failed to restart fleet %s: %s", fleet_id, err)
+            return False
+
     @async_retry()
     async def async_reboot_device(self, device_uuid: str) -> bool:
         """Reboot a device."""
@@ -496,13 +511,35 @@ class BalenaCloudAPIClient:
 
     @async_retry()
     async def async_get_device_url(self, device_uuid: str) -> Optional[str]:
-        """Get the public device URL."""
+        """Get the public device URL, retrying transient failures."""
+        return await self._async_get_device_url(device_uuid)
+
+    async def _async_get_device_url(self, device_uuid: str) -> Optional[str]:
+        """Get the public device URL in a single attempt.
+
+        Returns None when the device has no public URL enabled. Other
+        failures raise, so callers can tell "no URL" from "lookup failed".
+        Used directly by the coordinator's periodic URL pass, which retries
+        on a later refresh instead of backing off inline.
+        """
         try:
             url = await self._run_in_executor("models.device.get_device_url", device_uuid)
             return url
         except balena_exceptions.DeviceNotFound:
             _LOGGER.warning("Device with UUID %s not found", device_uuid)
             return None
+        except balena_exceptions.DeviceNotWebAccessible:
+            return None
+        except (
+            balena_exceptions.MalformedToken,
+            balena_exceptions.NotLoggedIn,
+            balena_exceptions.Unauthorized,
+        ) as err:
+            raise BalenaCloudAuthenticationError(ERROR_AUTH_FAILED) from err
+        except balena_exceptions.RequestError as err:
+            self._handle_request_error(
+                err, f"Failed to get device URL for {device_uuid}"
+            )
         except Exception as err:
             _LOGGER.debug("Failed to get device URL for %s: %s", device_uuid, err)
-            return None
+            raise BalenaCloudAPIError(ERROR_NETWORK_ERROR) from err
@@ -21,7 +21,9 @@ from .const import (ATTR_DEVICE_NAME, ATTR_DEVICE_TYPE, ATTR_DEVICE_UUID,
                     ATTR_OS_VERSION, ATTR_SUPERVISOR_VERSION, DOMAIN,
                     ICON_DEVICE, ICON_FLEET, ICON_OFFLINE, ICON_ONLINE)
 from .coordinator import BalenaCloudDataUpdateCoordinator
-from .device_registry import async_ensure_fleet_device
+from .device_registry import (async_ensure_fleet_devices,
+                              device_configuration_url,
+                              fleet_device_identifier)
 from .models import BalenaDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +43,7 @@ class BalenaCloudBinarySensorEntityDescription(
     """Describes Balena Cloud binary sensor entity."""
 
     attr_fn: Callable[[BalenaDevice], dict[str, Any]] | None = None
+    icon_fn: Callable[[BalenaDevice], str] | None = None
 
 
 BINARY_SENSOR_TYPES: tuple[BalenaCloudBinarySensorEntityDescription, ...] = (
@@ -50,6 +53,7 @@ BINARY_SENSOR_TYPES: tuple[BalenaCloudBinarySensorEntityDescription, ...] = (
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         icon=ICON_ONLINE,
         value_fn=lambda device: device.is_online,
+        icon_fn=lambda device: ICON_ONLINE if device.is_online else ICON_OFFLINE,
         attr_fn=lambda device: {
             "status": device.status,
             ATTR_LAST_SEEN: device.last_seen.isoformat() if device.last_seen else None,
@@ -81,8 +85,9 @@ async def async_setup_entry(
     ]
 
     # Ensure fleet devices exist in the device registry
-    for fleet in coordinator.fleets.values():
-        await async_ensure_fleet_device(hass, fleet, config_entry.entry_id)
+    async_ensure_fleet_devices(
+        hass, coordinator.fleets.values(), config_entry.entry_id
+    )
 
     # Track known device/description combinations to avoid duplicates
     known_entities: set[tuple[str, str]] = set()
@@ -91,12 +96,14 @@ async def async_setup_entry(
     def _check_for_new_devices() -> None:
         """Check for new devices and add entities for them."""
         # Ensure fleet devices exist for newly discovered fleets
-        for fleet in coordinator.fleets.values():
-            if fleet.id not in known_fleets:
-                known_fleets.add(fleet.id)
-                hass.async_create_task(
-                    async_ensure_fleet_device(hass, fleet, config_entry.entry_id)
-                )
+        new_fleets = [
+            fleet
+            for fleet in coordinator.fleets.values()
+            if fleet.id not in known_fleets
+        ]
+        if new_fleets:
+            known_fleets.update(fleet.id for fleet in new_fleets)
+            async_ensure_fleet_devices(hass, new_fleets, config_entry.entry_id)
 
         new_entities: list[BalenaCloudBinarySensorEntity] = []
 
@@ -164,37 +171,37 @@ class BalenaCloudBinarySensorEntity(
     @property
     def is_on(self) -> bool | None:
         """Return the state of the binary sensor."""
-        if self.device:
-            return self.entity_description.value_fn(self.device)
+        if device := self.device:
+            return self.entity_description.value_fn(device)
         return None
 
     @property
     def icon(self) -> str | None:
         """Return the icon of the binary sensor."""
-        if self.entity_description.key == "online" and self.device:
-            return ICON_ONLINE if self.device.is_online else ICON_OFFLINE
+        if (icon_fn := self.entity_description.icon_fn) and (device := self.device):
+            return icon_fn(device)
         return self.entity_description.icon
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.device:
+        if not (device := self.device):
             return {}
 
         attrs = {
-            ATTR_DEVICE_UUID: self.device.uuid,
-            ATTR_DEVICE_NAME: self.device.device_name,
-            ATTR_DEVICE_TYPE: self.device.device_type,
-            ATTR_FLEET_NAME: self.device.fleet_name,
-            ATTR_OS_VERSION: self.device.os_version,
-            ATTR_SUPERVISOR_VERSION: self.device.supervisor_version,
-            ATTR_MAC_ADDRESS: self.device.mac_address,
-            ATTR_IP_ADDRESS: self.device.ip_address,
+            ATTR_DEVICE_UUID: device.uuid,
+            ATTR_DEVICE_NAME: device.device_name,
+            ATTR_DEVICE_TYPE: device.device_type,
+            ATTR_FLEET_NAME: device.fleet_name,
+            ATTR_OS_VERSION: device.os_version,
+            ATTR_SUPERVISOR_VERSION: device.supervisor_version,
+            ATTR_MAC_ADDRESS: device.mac_address,
+            ATTR_IP_ADDRESS: device.ip_address,
         }
 
         # Add sensor-specific attributes
-        if self.entity_description.attr_fn:
-            attrs.update(self.entity_description.attr_fn(self.device))
+        if attr_fn := self.entity_description.attr_fn:
+            attrs.update(attr_fn(device))
 
         # Remove None values
         return {k: v for k, v in attrs.items() if v is not None}
@@ -211,6 +218,6 @@ class BalenaCloudBinarySensorEntity(
             manufacturer="Balena",
             model=device.device_type,
             sw_version=device.os_version,
-            configuration_url=f"https://dashboard.balena-cloud.com/devices/{device.uuid}",
-            via_device=(DOMAIN, f"fleet_{device.fleet_id}"),
+            configuration_url=device_configuration_url(device.uuid),
+            via_device=fleet_device_identifier(device.fleet_id),
         )
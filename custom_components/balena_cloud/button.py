@@ -11,17 +11,15 @@ from homeassistant.components.button import (ButtonEntity,
                                              ButtonEntityDescription)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (ATTR_DEVICE_NAME, ATTR_DEVICE_TYPE, ATTR_DEVICE_UUID,
                     ATTR_FLEET_ID, ATTR_FLEET_NAME, ATTR_IS_ONLINE,
                     ATTR_LAST_SEEN, ATTR_OS_VERSION, ATTR_SUPERVISOR_VERSION,
                     DOMAIN, ICON_DEVICE, ICON_FLEET, ICON_REBOOT, ICON_RESTART)
 from .coordinator import BalenaCloudDataUpdateCoordinator
-from .device_registry import async_ensure_fleet_device
-from .models import BalenaDevice
+from .device_registry import async_ensure_fleet_devices
+from .entity import BalenaCloudDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,8 +77,9 @@ async def async_setup_entry(
     ]
 
     # Ensure fleet devices exist in the device registry
-    for fleet in coordinator.fleets.values():
-        await async_ensure_fleet_device(hass, fleet, config_entry.entry_id)
+    async_ensure_fleet_devices(
+        hass, coordinator.fleets.values(), config_entry.entry_id
+    )
 
     # Track known device/description combinations to avoid duplicates
     known_entities: set[tuple[str, str]] = set()
@@ -89,29 +88,32 @@ async def async_setup_entry(
     def _check_for_new_devices() -> None:
         """Check for new devices and add entities for them."""
         # Ensure fleet devices exist for newly discovered fleets
-        for fleet in coordinator.fleets.values():
-            if fleet.id not in known_fleets:
-                known_fleets.add(fleet.id)
-                hass.async_create_task(
-                    async_ensure_fleet_device(hass, fleet, config_entry.entry_id)
-                )
-
-        new_entities: list[BalenaCloudButtonEntity] = []
-
-        for device_uuid, device in coordinator.devices.items():
-            for description in BUTTON_TYPES:
-                entity_key = (device_uuid, description.key)
-                if entity_key not in known_entities:
-                    known_entities.add(entity_key)
-                    new_entities.append(
-                        BalenaCloudButtonEntity(
-                            coordinator=coordinator,
-                            description=description,
-                            device_uuid=device_uuid,
-                        )
-                    )
+        new_fleets = [
+            fleet
+            for fleet in coordinator.fleets.values()
+            if fleet.id not in known_fleets
+        ]
+        if new_fleets:
+            known_fleets.update(fleet.id for fleet in new_fleets)
+            async_ensure_fleet_devices(hass, new_fleets, config_entry.entry_id)
+
+        button_types = BUTTON_TYPES
+        new_entities: list[BalenaCloudButtonEntity] = [
+            BalenaCloudButtonEntity(
+                coordinator=coordinator,
+                description=description,
+                device_uuid=device_uuid,
+            )
+            for device_uuid in coordinator.devices
+            for description in button_types
+            if (device_uuid, description.key) not in known_entities
+        ]
 
         if new_entities:
+            known_entities.update(
+                (entity._device_uuid, entity.entity_description.key)
+                for entity in new_entities
+            )
             async_add_entities(new_entities)
 
     # Check for devices initially
@@ -123,9 +125,7 @@ async def async_setup_entry(
     )
 
 
-class BalenaCloudButtonEntity(
-    CoordinatorEntity[BalenaCloudDataUpdateCoordinator], ButtonEntity
-):
+class BalenaCloudButtonEntity(BalenaCloudDeviceEntity, ButtonEntity):
     """Representation of a Balena Cloud button."""
 
     entity_description: BalenaCloudButtonEntityDescription
@@ -137,39 +137,26 @@ class BalenaCloudButtonEntity(
         device_uuid: str,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_uuid)
         self.entity_description = description
-        self._device_uuid = device_uuid
         self._attr_unique_id = f"{device_uuid}_{description.key}"
-
-    @property
-    def device(self) -> BalenaDevice | None:
-        """Return the device."""
-        return self.coordinator.get_device(self._device_uuid)
+        self._attr_name = description.name
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return super().available and self.device is not None and self.device.is_online
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        if self.device:
-            return f"{self.device.display_name} {self.entity_description.name}"
-        return f"Unknown Device {self.entity_description.name}"
-
     async def async_press(self) -> None:
         """Handle the button press."""
-        if not self.device:
+        if not (device := self.device):
             _LOGGER.error("Device not found for button %s", self._attr_unique_id)
             return
 
-        _LOGGER.info(
-            "Executing %s for device %s",
-            self.entity_description.name,
-            self.device.display_name,
-        )
+        action_name = self.entity_description.name
+        display_name = device.display_name
+
+        _LOGGER.info("Executing %s for device %s", action_name, display_name)
 
         try:
             success = await self.entity_description.action_fn(
@@ -178,48 +165,27 @@ class BalenaCloudButtonEntity(
             if success:
                 _LOGGER.info(
                     "Successfully executed %s for device %s",
-                    self.entity_description.name,
-                    self.device.display_name,
+                    action_name,
+                    display_name,
                 )
             else:
                 _LOGGER.error(
-                    "Failed to execute %s for device %s",
-                    self.entity_description.name,
-                    self.device.display_name,
+                    "Failed to execute %s for device %s", action_name, display_name
                 )
         except Exception as err:
             _LOGGER.error(
-                "Error executing %s for device %s: %s",
-                self.entity_description.name,
-                self.device.display_name,
-                err,
+                "Error executing %s for device %s: %s", action_name, display_name, err
             )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.device:
+        if not (device := self.device):
             return {}
 
         return {
-            ATTR_DEVICE_UUID: self.device.uuid,
-            ATTR_DEVICE_NAME: self.device.device_name,
-            ATTR_DEVICE_TYPE: self.device.device_type,
-            ATTR_FLEET_NAME: self.device.fleet_name,
+            ATTR_DEVICE_UUID: device.uuid,
+            ATTR_DEVICE_NAME: device.device_name,
+            ATTR_DEVICE_TYPE: device.device_type,
+            ATTR_FLEET_NAME: device.fleet_name,
         }
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info."""
-        if not (device := self.device):
-            return None
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, device.uuid)},
-            name=device.display_name,
-            manufacturer="Balena",
-            model=device.device_type,
-            sw_version=device.os_version,
-            configuration_url=f"https://dashboard.balena-cloud.com/devices/{device.uuid}",
-            via_device=(DOMAIN, f"fleet_{device.fleet_id}"),
-        )
@@ -98,3 +98,10 @@ SERVICE_SHUTDOWN_DEVICE: Final = "shutdown_device"
 SERVICE_UPDATE_ENVIRONMENT: Final = "update_environment"
 SERVICE_ENABLE_DEVICE_URL: Final = "enable_device_url"
 SERVICE_DISABLE_DEVICE_URL: Final = "disable_device_url"
+SERVICE_BULK_RESTART: Final = "bulk_restart"
+SERVICE_BULK_REBOOT: Final = "bulk_reboot"
+SERVICE_RESTART_FLEET: Final = "restart_fleet"
+SERVICE_GET_FLEET_HEALTH: Final = "get_fleet_health"
+
+# Events
+EVENT_FLEET_HEALTH_RESPONSE: Final = f"{DOMAIN}_fleet_health_response"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -15,10 +17,17 @@ from homeassistant.helpers.update_coordinator import (DataUpdateCoordinator,
 from .api import BalenaCloudAPIClient, BalenaCloudAPIError
 from .const import (CONF_API_TOKEN, CONF_FLEETS, CONF_INCLUDE_OFFLINE_DEVICES,
                     CONF_UPDATE_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN)
-from .models import BalenaDevice, BalenaFleet
+from .models import BalenaDevice, BalenaFleet, assess_device_health
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on concurrent public URL lookups during a refresh
+URL_FETCH_CONCURRENCY = 8
+
+# How often every device's public URL is re-checked. Toggling the switch
+# updates the URL directly, so this only catches changes made elsewhere.
+URL_REFRESH_INTERVAL = timedelta(minutes=10)
+
 
 class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the Balena Cloud API."""
@@ -27,8 +36,8 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         entry: ConfigEntry,
-        config_data: Dict[str, Any],
-        options: Dict[str, Any],
+        config_data: Mapping[str, Any],
+        options: Mapping[str, Any],
     ) -> None:
         """Initialize the coordinator."""
         self.entry = entry
@@ -48,6 +57,18 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
         # Store fleets and devices data
         self.fleets: Dict[int, BalenaFleet] = {}
         self.devices: Dict[str, BalenaDevice] = {}
+        self.device_urls: Dict[str, Optional[str]] = {}
+        self._urls_refreshed: Optional[datetime] = None
+        # Devices whose URL lookup failed since the last full URL pass
+        self._url_lookup_failed: set[str] = set()
+
+        # Formatted once per refresh and shared by every entity that reports it
+        self.last_update_iso: Optional[str] = None
+
+        # Fleet ID -> devices index, built lazily for the current devices dict
+        self._devices_by_fleet: Optional[
+            tuple[Dict[str, BalenaDevice], Dict[int, List[BalenaDevice]]]
+        ] = None
 
         # Track stale fleet IDs already warned about so we don't log every cycle
         self._warned_stale_fleet_ids: set[str] = set()
@@ -58,6 +79,7 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            always_update=False,
         )
 
     async def _async_update_data(self) -> Dict[str, Any]:
@@ -71,6 +93,10 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
             # Fetch devices for selected fleets
             await self._async_update_devices()
 
+            # Fetch public URLs for new devices, and for all of them once
+            # per URL_REFRESH_INTERVAL
+            await self._async_update_urls()
+
             # Prune HA device registry entries for fleets/devices that no
             # longer exist in Balena Cloud (or are no longer selected).
             try:
@@ -80,11 +106,14 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
                     "Failed to clean up stale devices: %s", cleanup_err
                 )
 
-            # Return combined data
+            # Return combined data. Fleets and devices are fresh dicts every
+            # refresh, so an unchanged account compares equal to the previous
+            # data and listeners are not called (always_update=False).
+            self.last_update_iso = datetime.now().isoformat()
             return {
                 "fleets": self.fleets,
                 "devices": self.devices,
-                "last_update": datetime.now(),
+                "device_urls": self.device_urls,
             }
 
         except BalenaCloudAPIError as err:
@@ -100,10 +129,11 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Fetching fleets from Balena Cloud")
             fleets_data = await self.api.async_get_fleets()
 
-            self.fleets.clear()
+            fleets: Dict[int, BalenaFleet] = {}
             for fleet_data in fleets_data:
                 fleet = BalenaFleet.from_api_data(fleet_data)
-                self.fleets[fleet.id] = fleet
+                fleets[fleet.id] = fleet
+            self.fleets = fleets
 
             _LOGGER.debug("Found %d fleets", len(self.fleets))
 
@@ -188,7 +218,7 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
                 all_devices = all_devices_raw
 
             # Process device data
-            self.devices.clear()
+            devices: Dict[str, BalenaDevice] = {}
             processed_count = 0
             skipped_offline_count = 0
             for device_data in all_devices:
@@ -222,14 +252,17 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
                             device.uuid,
                             metrics_err,
                         )
+                    device.health_status = assess_device_health(device.metrics)
 
-                    self.devices[device.uuid] = device
+                    devices[device.uuid] = device
                     processed_count += 1
 
                 except Exception as device_err:
                     _LOGGER.warning("Failed to process device data: %s", device_err, exc_info=True)
                     continue
 
+            self.devices = devices
+
             _LOGGER.debug(
                 "Processed %d devices, skipped %d offline devices, total devices: %d",
                 processed_count, skipped_offline_count, len(self.devices)
@@ -239,6 +272,62 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to update devices: %s", err)
             raise
 
+    async def _async_update_urls(self) -> None:
+        """Update public URLs for devices.
+
+        New devices are looked up on the refresh that finds them; known ones
+        are re-checked once per URL_REFRESH_INTERVAL. Lookups are not retried
+        inline: a failed one keeps the last known URL and waits for the next
+        full pass.
+        """
+        now = datetime.now()
+        if (
+            self._urls_refreshed is None
+            or now - self._urls_refreshed >= URL_REFRESH_INTERVAL
+        ):
+            self._urls_refreshed = now
+            self._url_lookup_failed = set()
+            device_uuids = list(self.devices)
+        else:
+            device_uuids = [
+                device_uuid
+                for device_uuid in self.devices
+                if device_uuid not in self.device_urls
+                and device_uuid not in self._url_lookup_failed
+            ]
+
+        # Always a new dict: the previous one may be held by self.data
+        device_urls: Dict[str, Optional[str]] = {
+            device_uuid: url
+            for device_uuid, url in self.device_urls.items()
+            if device_uuid in self.devices
+        }
+
+        if device_uuids:
+            semaphore = asyncio.Semaphore(URL_FETCH_CONCURRENCY)
+
+            async def _get_url(device_uuid: str) -> Optional[str]:
+                async with semaphore:
+                    return await self.api._async_get_device_url(device_uuid)
+
+            results = await asyncio.gather(
+                *(_get_url(device_uuid) for device_uuid in device_uuids),
+                return_exceptions=True,
+            )
+
+            for device_uuid, result in zip(device_uuids, results):
+                if isinstance(result, BaseException):
+                    _LOGGER.debug(
+                        "Could not fetch public URL for device %s: %s",
+                        device_uuid,
+                        result,
+                    )
+                    self._url_lookup_failed.add(device_uuid)
+                    continue
+                device_urls[device_uuid] = result
+
+        self.device_urls = device_urls
+
     def _cleanup_stale_devices(self) -> None:
         """Remove HA device registry entries no longer present in Balena Cloud."""
         device_registry = dr.async_get(self.hass)
@@ -289,6 +378,19 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
 
         return result
 
+    async def async_restart_fleet(self, fleet_id: int) -> bool:
+        """Restart the application on every device in a fleet."""
+        if fleet_id not in self.fleets:
+            _LOGGER.error("Fleet %s not found", fleet_id)
+            return False
+
+        result = await self.api.async_restart_fleet(fleet_id)
+        if result:
+            # Trigger a data refresh to get updated status
+            await self.async_request_refresh()
+
+        return result
+
     async def async_reboot_device(self, device_uuid: str) -> bool:
         """Reboot a device."""
         if device_uuid not in self.devices:
@@ -346,7 +448,13 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Device %s not found", device_uuid)
             return False
 
-        return await self.api.async_disable_device_url(device_uuid)
+        result = await self.api.async_disable_device_url(device_uuid)
+        if result:
+            # Replace rather than mutate, so the next refresh still compares
+            # against the URLs held by the current data
+            self.device_urls = {**self.device_urls, device_uuid: None}
+
+        return result
 
     async def async_get_device_url(self, device_uuid: str) -> Optional[str]:
         """Get public device URL."""
@@ -354,7 +462,20 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Device %s not found", device_uuid)
             return None
 
-        return await self.api.async_get_device_url(device_uuid)
+        try:
+            url = await self.api.async_get_device_url(device_uuid)
+        except BalenaCloudAPIError:
+            # Forget the stale entry so the next refresh looks it up again
+            self.device_urls = {
+                uuid: known_url
+                for uuid, known_url in self.device_urls.items()
+                if uuid != device_uuid
+            }
+            self._url_lookup_failed.discard(device_uuid)
+            raise
+        self.device_urls = {**self.device_urls, device_uuid: url}
+
+        return url
 
     def get_device(self, device_uuid: str) -> Optional[BalenaDevice]:
         """Get device by UUID."""
@@ -366,9 +487,13 @@ class BalenaCloudDataUpdateCoordinator(DataUpdateCoordinator):
 
     def get_devices_by_fleet(self, fleet_id: int) -> List[BalenaDevice]:
         """Get all devices for a specific fleet."""
-        return [
-            device for device in self.devices.values() if device.fleet_id == fleet_id
-        ]
+        cache = self._devices_by_fleet
+        if cache is None or cache[0] is not self.devices:
+            index: Dict[int, List[BalenaDevice]] = {}
+            for device in self.devices.values():
+                index.setdefault(device.fleet_id, []).append(device)
+            cache = self._devices_by_fleet = (self.devices, index)
+        return list(cache[1].get(fleet_id, ()))
 
     @property
     def online_devices_count(self) -> int:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from homeassistant.core import HomeAssistant
+from collections.abc import Iterable
+
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 
@@ -13,17 +15,28 @@ from .models import BalenaFleet
 _LOGGER = logging.getLogger(__name__)
 
 
+def fleet_device_identifier(fleet_id: int) -> tuple[str, str]:
+    """Get the device registry identifier for a fleet."""
+    return (DOMAIN, f"fleet_{fleet_id}")
+
+
+def device_configuration_url(device_uuid: str) -> str:
+    """Get the Balena dashboard URL for a device."""
+    return f"https://dashboard.balena-cloud.com/devices/{device_uuid}"
+
+
 def async_get_fleet_device_info(fleet: BalenaFleet) -> DeviceInfo:
     """Get device info for a fleet."""
     return DeviceInfo(
-        identifiers={(DOMAIN, f"fleet_{fleet.id}")},
+        identifiers={fleet_device_identifier(fleet.id)},
         name=fleet.display_name,
         manufacturer="Balena",
         model=fleet.device_type,
     )
 
 
-async def async_ensure_fleet_device(
+@callback
+def async_ensure_fleet_device(
     hass: HomeAssistant, fleet: BalenaFleet, config_entry_id: str | None = None
 ) -> dr.DeviceEntry | None:
     """Ensure a fleet device exists in the device registry.
@@ -39,11 +52,25 @@ async def async_ensure_fleet_device(
         device_registry = dr.async_get(hass)
         return device_registry.async_get_or_create(
             config_entry_id=config_entry_id,
-            identifiers={(DOMAIN, f"fleet_{fleet.id}")},
+            identifiers={fleet_device_identifier(fleet.id)},
             name=fleet.display_name,
             manufacturer="Balena",
             model=fleet.device_type,
         )
     except Exception as e:
         _LOGGER.debug("Could not create fleet device in registry: %s", e)
-        return None
\ No newline at end of file
+        return None
+
+
+@callback
+def async_ensure_fleet_devices(
+    hass: HomeAssistant,
+    fleets: Iterable[BalenaFleet],
+    config_entry_id: str | None = None,
+) -> None:
+    """Ensure fleet devices exist in the device registry for several fleets.
+
+    A fleet that fails to register does not stop the others.
+    """
+    for fleet in fleets:
+        async_ensure_fleet_device(hass, fleet, config_entry_id)
@@ -0,0 +1,62 @@
+"""Base entity for Balena Cloud devices."""
+
+from __future__ import annotations
+
+from functools import cached_property
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import BalenaCloudDataUpdateCoordinator
+from .device_registry import device_configuration_url, fleet_device_identifier
+from .models import BalenaDevice
+
+
+class BalenaCloudDeviceEntity(CoordinatorEntity[BalenaCloudDataUpdateCoordinator]):
+    """Base class for entities attached to a single Balena device."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: BalenaCloudDataUpdateCoordinator,
+        device_uuid: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device_uuid = device_uuid
+        self._device_cache: BalenaDevice | None = None
+        self._device_loaded = False
+
+    @property
+    def device(self) -> BalenaDevice | None:
+        """Return the device, looked up once per coordinator update."""
+        if not self._device_loaded:
+            self._device_cache = self.coordinator.get_device(self._device_uuid)
+            self._device_loaded = True
+        return self._device_cache
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached device and device info before writing the new state."""
+        self._device_loaded = False
+        self.__dict__.pop("device_info", None)
+        super()._handle_coordinator_update()
+
+    @cached_property
+    def device_info(self) -> DeviceInfo | None:
+        """Return device info, cached until the next coordinator update."""
+        if not (device := self.device):
+            return None
+
+        return DeviceInfo(
+            identifiers={(DOMAIN, device.uuid)},
+            name=device.display_name,
+            manufacturer="Balena",
+            model=device.device_type,
+            sw_version=device.os_version,
+            configuration_url=device_configuration_url(device.uuid),
+            via_device=fleet_device_identifier(device.fleet_id),
+        )
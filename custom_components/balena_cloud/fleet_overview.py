@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any, Dict, List
 
 from homeassistant.core import HomeAssistant
@@ -29,6 +28,11 @@ class BalenaFleetOverview(CoordinatorEntity[BalenaCloudDataUpdateCoordinator]):
         super().__init__(coordinator)
         self._fleet_id = fleet_id
         self._attr_unique_id = f"fleet_overview_{fleet_id}"
+        # (coordinator.devices it was computed from, statistics)
+        self._statistics_cache: (
+            tuple[Dict[str, BalenaDevice], Dict[str, Any]] | None
+        ) = None
+        self._fleet_info_cache: tuple[BalenaFleet, Dict[str, Any]] | None = None
 
     @property
     def fleet(self) -> BalenaFleet | None:
@@ -59,6 +63,16 @@ class BalenaFleetOverview(CoordinatorEntity[BalenaCloudDataUpdateCoordinator]):
 
     @property
     def fleet_statistics(self) -> Dict[str, Any]:
+        """Return fleet statistics, calculated once per devices refresh."""
+        cache = self._statistics_cache
+        if cache is None or cache[0] is not self.coordinator.devices:
+            cache = self._statistics_cache = (
+                self.coordinator.devices,
+                self._calculate_fleet_statistics(),
+            )
+        return cache[1]
+
+    def _calculate_fleet_statistics(self) -> Dict[str, Any]:
         """Calculate comprehensive fleet statistics."""
         devices = self.devices
 
@@ -116,7 +130,7 @@ class BalenaFleetOverview(CoordinatorEntity[BalenaCloudDataUpdateCoordinator]):
             "health_summary": health_summary,
             "device_types": device_types,
             "status_distribution": status_distribution,
-            "last_update": datetime.now().isoformat(),
+            "last_update": self.coordinator.last_update_iso,
         }
 
     def _calculate_average_metrics(
@@ -126,25 +140,18 @@ class BalenaFleetOverview(CoordinatorEntity[BalenaCloudDataUpdateCoordinator]):
         if not devices_with_metrics:
             return {}
 
+        metrics = [d.metrics for d in devices_with_metrics if d.metrics]
         cpu_values = [
-            d.metrics.cpu_percentage
-            for d in devices_with_metrics
-            if d.metrics and d.metrics.cpu_percentage is not None
+            value for m in metrics if (value := m.cpu_percentage) is not None
         ]
         memory_values = [
-            d.metrics.memory_percentage
-            for d in devices_with_metrics
-            if d.metrics and d.metrics.memory_percentage is not None
+            value for m in metrics if (value := m.memory_percentage) is not None
         ]
         storage_values = [
-            d.metrics.storage_percentage
-            for d in devices_with_metrics
-            if d.metrics and d.metrics.storage_percentage is not None
+            value for m in metrics if (value := m.storage_percentage) is not None
         ]
         temp_values = [
-            d.metrics.temperature
-            for d in devices_with_metrics
-            if d.metrics and d.metrics.temperature is not None
+            value for m in metrics if (value := m.temperature) is not None
         ]
 
         return {
@@ -230,67 +237,41 @@ class BalenaFleetOverview(CoordinatorEntity[BalenaCloudDataUpdateCoordinator]):
         }
 
     def _assess_device_health(self, device: BalenaDevice) -> Dict[str, str]:
-        """Assess individual device health for fleet calculations."""
-        if not device.metrics:
-            return {"status": "unknown"}
-
-        critical_conditions = []
-        warning_conditions = []
-
-        metrics = device.metrics
-
-        # Check critical conditions
-        if metrics.cpu_percentage is not None and metrics.cpu_percentage > 95:
-            critical_conditions.append("cpu")
-        if metrics.memory_percentage is not None and metrics.memory_percentage > 95:
-            critical_conditions.append("memory")
-        if metrics.storage_percentage is not None and metrics.storage_percentage > 98:
-            critical_conditions.append("storage")
-        if metrics.temperature is not None and metrics.temperature > 85:
-            critical_conditions.append("temperature")
-
-        # Check warning conditions
-        if metrics.cpu_percentage is not None and 80 < metrics.cpu_percentage <= 95:
-            warning_conditions.append("cpu")
-        if (
-            metrics.memory_percentage is not None
-            and 85 < metrics.memory_percentage <= 95
-        ):
-            warning_conditions.append("memory")
-        if (
-            metrics.storage_percentage is not None
-            and 90 < metrics.storage_percentage <= 98
-        ):
-            warning_conditions.append("storage")
-        if metrics.temperature is not None and 75 < metrics.temperature <= 85:
-            warning_conditions.append("temperature")
-
-        if critical_conditions:
-            return {"status": "critical"}
-        elif warning_conditions:
-            return {"status": "warning"}
-        else:
-            return {"status": "healthy"}
+        """Assess individual device health for fleet calculations.
+
+        Health is assessed once per refresh by the coordinator.
+        """
+        return {"status": device.health_status}
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes."""
-        attrs = self.fleet_statistics.copy()
+    def fleet_info(self) -> Dict[str, Any] | None:
+        """Return the static fleet attributes, rebuilt only when the fleet changes."""
+        if not (fleet := self.fleet):
+            return None
 
-        if self.fleet:
-            attrs.update(
+        cached = self._fleet_info_cache
+        if cached is None or cached[0] is not fleet:
+            cached = self._fleet_info_cache = (
+                fleet,
                 {
-                    "fleet_id": self.fleet.id,
-                    "fleet_name": self.fleet.app_name,
-                    "fleet_slug": self.fleet.slug,
-                    "device_type": self.fleet.device_type,
+                    "fleet_id": fleet.id,
+                    "fleet_name": fleet.app_name,
+                    "fleet_slug": fleet.slug,
+                    "device_type": fleet.device_type,
                     "created_at": (
-                        self.fleet.created_at.isoformat()
-                        if self.fleet.created_at
-                        else None
+                        fleet.created_at.isoformat() if fleet.created_at else None
                     ),
-                }
+                },
             )
+        return cached[1]
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the state attributes."""
+        attrs = self.fleet_statistics.copy()
+
+        if fleet_info := self.fleet_info:
+            attrs.update(fleet_info)
 
         return attrs
 
@@ -320,10 +301,6 @@ async def async_setup_fleet_overviews(
     coordinator: BalenaCloudDataUpdateCoordinator,
 ) -> List[BalenaFleetOverview]:
     """Set up fleet overview entities for all discovered fleets."""
-    overviews = []
-
-    for fleet_id in coordinator.fleets:
-        overview = BalenaFleetOverview(coordinator, fleet_id)
-        overviews.append(overview)
-
-    return overviews
+    return [
+        BalenaFleetOverview(coordinator, fleet_id) for fleet_id in coordinator.fleets
+    ]
@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Dict, Optional
 
+# (metric attribute, (warning above, critical above)) per health check.
+# bisect_left against the breakpoints maps a value to 0=healthy, 1=warning,
+# 2=critical, matching the strict ">" comparisons of the thresholds.
+_HEALTH_THRESHOLDS: tuple[tuple[str, tuple[float, float]], ...] = (
+    ("cpu_percentage", (80, 95)),
+    ("memory_percentage", (85, 95)),
+    ("storage_percentage", (90, 98)),
+    ("temperature", (75, 85)),
+)
+_HEALTH_LEVELS: tuple[str, ...] = ("healthy", "warning", "critical")
+
 
 @dataclass
 class BalenaFleet:
@@ -124,6 +137,7 @@ class BalenaDevice:
     created_at: Optional[datetime] = None
     modified_at: Optional[datetime] = None
     metrics: Optional[BalenaDeviceMetrics] = None
+    health_status: str = "unknown"
 
     @classmethod
     def from_api_data(cls, data: Dict[str, Any], fleet_name: str = "") -> BalenaDevice:
@@ -158,9 +172,13 @@ class BalenaDevice:
         """Get unique identifier for the device."""
         return self.uuid
 
-    @property
+    @cached_property
     def display_name(self) -> str:
-        """Get display name for the device."""
+        """Get display name for the device.
+
+        Devices are rebuilt from API data on every refresh, so the name is
+        computed once per instance.
+        """
         if self.device_name:
             return self.device_name
         return self.uuid
@@ -196,6 +214,24 @@ class BalenaDevice:
         )
 
 
+def assess_device_health(metrics: Optional[BalenaDeviceMetrics]) -> str:
+    """Assess device health from its metrics.
+
+    Returns "unknown" without metrics, otherwise the worst of "healthy",
+    "warning" and "critical" across the thresholded metrics.
+    """
+    if not metrics:
+        return "unknown"
+
+    severity = 0
+    for attribute, breakpoints in _HEALTH_THRESHOLDS:
+        value = getattr(metrics, attribute)
+        if value is not None:
+            severity = max(severity, bisect_left(breakpoints, value))
+
+    return _HEALTH_LEVELS[severity]
+
+
 @dataclass
 class BalenaService:
     """Represents a service running on a Balena device."""
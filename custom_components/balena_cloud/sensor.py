@@ -46,7 +46,11 @@ from .const import (
     ICON_TEMPERATURE,
 )
 from .coordinator import BalenaCloudDataUpdateCoordinator
-from .device_registry import async_ensure_fleet_device
+from .device_registry import (
+    async_ensure_fleet_devices,
+    device_configuration_url,
+    fleet_device_identifier,
+)
 from .models import BalenaDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -66,6 +70,9 @@ class BalenaCloudSensorEntityDescription(
     """Describes Balena Cloud sensor entity."""
 
     attr_fn: Callable[[BalenaDevice], dict[str, Any]] | None = None
+    # Device-specific sensors go unavailable while the device is offline;
+    # cloud-level ones (like the fleet name) stay available.
+    requires_online: bool = False
 
 
 SENSOR_TYPES: tuple[BalenaCloudSensorEntityDescription, ...] = (
@@ -75,6 +82,7 @@ SENSOR_TYPES: tuple[BalenaCloudSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon=ICON_CPU,
+        requires_online=True,
         value_fn=lambda device: (
             device.metrics.cpu_percentage if device.metrics else None
         ),
@@ -85,6 +93,7 @@ SENSOR_TYPES: tuple[BalenaCloudSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon=ICON_MEMORY,
+        requires_online=True,
         value_fn=lambda device: (
             device.metrics.memory_percentage if device.metrics else None
         ),
@@ -99,6 +108,7 @@ SENSOR_TYPES: tuple[BalenaCloudSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon=ICON_STORAGE,
+        requires_online=True,
         value_fn=lambda device: (
             device.metrics.storage_percentage if device.metrics else None
         ),
@@ -118,6 +128,7 @@ SENSOR_TYPES: tuple[BalenaCloudSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon=ICON_TEMPERATURE,
+        requires_online=True,
         value_fn=lambda device: (
             device.metrics.temperature_rounded if device.metrics else None
         ),
@@ -136,6 +147,7 @@ SENSOR_TYPES: tuple[BalenaCloudSensorEntityDescription, ...] = (
         key="ip_address",
         name="IP Address",
         icon=ICON_IP_ADDRESS,
+        requires_online=True,
         value_fn=lambda device: device.ip_address,
         attr_fn=lambda device: {
             ATTR_IP_ADDRESS: device.ip_address,
@@ -162,8 +174,9 @@ async def async_setup_entry(
     ]
 
     # Ensure fleet devices exist in the device registry
-    for fleet in coordinator.fleets.values():
-        await async_ensure_fleet_device(hass, fleet, config_entry.entry_id)
+    async_ensure_fleet_devices(
+        hass, coordinator.fleets.values(), config_entry.entry_id
+    )
 
     # Track known device/description combinations to avoid duplicates
     known_entities: set[tuple[str, str]] = set()
@@ -172,12 +185,14 @@ async def async_setup_entry(
     def _check_for_new_devices() -> None:
         """Check for new devices and add entities for them."""
         # Ensure fleet devices exist for newly discovered fleets
-        for fleet in coordinator.fleets.values():
-            if fleet.id not in known_fleets:
-                known_fleets.add(fleet.id)
-                hass.async_create_task(
-                    async_ensure_fleet_device(hass, fleet, config_entry.entry_id)
-                )
+        new_fleets = [
+            fleet
+            for fleet in coordinator.fleets.values()
+            if fleet.id not in known_fleets
+        ]
+        if new_fleets:
+            known_fleets.update(fleet.id for fleet in new_fleets)
+            async_ensure_fleet_devices(hass, new_fleets, config_entry.entry_id)
 
         new_entities: list[BalenaCloudSensorEntity] = []
 
@@ -240,24 +255,13 @@ class BalenaCloudSensorEntity(
         Cloud entities (fleet name) remain available even when device is offline since
         they represent cloud-level information that exists regardless of device state.
         """
-        device_available = super().available and self.device is not None
-
         # If device doesn't exist or coordinator is unavailable, sensor is unavailable
-        if not device_available:
+        if not super().available or (device := self.device) is None:
             return False
 
         # For device-specific sensors, check if device is online
-        # Cloud entities (like fleet_name) should remain available even when device is offline
-        device_specific_sensors = {
-            "cpu_usage",
-            "memory_usage",
-            "storage_usage",
-            "temperature",
-            "ip_address"
-        }
-
-        if self.entity_description.key in device_specific_sensors:
-            return self.device.is_online
+        if self.entity_description.requires_online:
+            return device.is_online
 
         # Cloud entities remain available even when device is offline
         return True
@@ -272,36 +276,36 @@ class BalenaCloudSensorEntity(
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.device:
-            return self.entity_description.value_fn(self.device)
+        if device := self.device:
+            return self.entity_description.value_fn(device)
         return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.device:
+        if not (device := self.device):
             return {}
 
         attrs = {
-            ATTR_DEVICE_UUID: self.device.uuid,
-            ATTR_DEVICE_NAME: self.device.device_name,
-            ATTR_DEVICE_TYPE: self.device.device_type,
-            ATTR_FLEET_ID: self.device.fleet_id,
-            ATTR_FLEET_NAME: self.device.fleet_name,
-            ATTR_IS_ONLINE: self.device.is_online,
-            ATTR_OS_VERSION: self.device.os_version,
-            ATTR_SUPERVISOR_VERSION: self.device.supervisor_version,
-            ATTR_IP_ADDRESS: self.device.ip_address,
-            ATTR_PUBLIC_ADDRESS: self.device.public_address,
-            ATTR_MAC_ADDRESS: self.device.mac_address,
+            ATTR_DEVICE_UUID: device.uuid,
+            ATTR_DEVICE_NAME: device.device_name,
+            ATTR_DEVICE_TYPE: device.device_type,
+            ATTR_FLEET_ID: device.fleet_id,
+            ATTR_FLEET_NAME: device.fleet_name,
+            ATTR_IS_ONLINE: device.is_online,
+            ATTR_OS_VERSION: device.os_version,
+            ATTR_SUPERVISOR_VERSION: device.supervisor_version,
+            ATTR_IP_ADDRESS: device.ip_address,
+            ATTR_PUBLIC_ADDRESS: device.public_address,
+            ATTR_MAC_ADDRESS: device.mac_address,
             ATTR_LAST_SEEN: (
-                self.device.last_seen.isoformat() if self.device.last_seen else None
+                last_seen.isoformat() if (last_seen := device.last_seen) else None
             ),
         }
 
         # Add sensor-specific attributes
-        if self.entity_description.attr_fn:
-            attrs.update(self.entity_description.attr_fn(self.device))
+        if attr_fn := self.entity_description.attr_fn:
+            attrs.update(attr_fn(device))
 
         # Remove None values
         return {k: v for k, v in attrs.items() if v is not None}
@@ -318,6 +322,6 @@ class BalenaCloudSensorEntity(
             manufacturer="Balena",
             model=device.device_type,
             sw_version=device.os_version,
-            configuration_url=f"https://dashboard.balena-cloud.com/devices/{device.uuid}",
-            via_device=(DOMAIN, f"fleet_{device.fleet_id}"),
+            configuration_url=device_configuration_url(device.uuid),
+            via_device=fleet_device_identifier(device.fleet_id),
         )
@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Dict
+from collections import Counter
+from collections.abc import Awaitable, Callable, ValuesView
+from functools import partial
+from types import MethodType
+from typing import Any, Dict, List, Tuple
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 
-from .const import (DOMAIN, SERVICE_DISABLE_DEVICE_URL,
-                    SERVICE_ENABLE_DEVICE_URL, SERVICE_REBOOT_DEVICE,
-                    SERVICE_RESTART_APPLICATION, SERVICE_SHUTDOWN_DEVICE,
+from .const import (DOMAIN, EVENT_FLEET_HEALTH_RESPONSE, SERVICE_BULK_REBOOT,
+                    SERVICE_BULK_RESTART, SERVICE_DISABLE_DEVICE_URL,
+                    SERVICE_ENABLE_DEVICE_URL, SERVICE_GET_FLEET_HEALTH,
+                    SERVICE_REBOOT_DEVICE, SERVICE_RESTART_APPLICATION,
+                    SERVICE_RESTART_FLEET, SERVICE_SHUTDOWN_DEVICE,
                     SERVICE_UPDATE_ENVIRONMENT)
 from .coordinator import BalenaCloudDataUpdateCoordinator
+from .models import BalenaDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of concurrent Balena API calls issued by bulk services
+BULK_CONCURRENCY = 10
+
+# hass.data[DOMAIN] key holding the shared service handler
+SERVICE_HANDLER_KEY = "service_handler"
+
 # Service schemas
 RESTART_APPLICATION_SCHEMA = vol.Schema(
     {
@@ -53,6 +67,54 @@ DEVICE_URL_SCHEMA = vol.Schema(
     }
 )
 
+BULK_RESTART_SCHEMA = vol.Schema(
+    {
+        vol.Optional("device_uuids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("fleet_id"): vol.Coerce(int),
+        vol.Optional("service_name"): cv.string,
+        vol.Optional("confirm", default=False): cv.boolean,
+    }
+)
+
+BULK_REBOOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional("device_uuids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("fleet_id"): vol.Coerce(int),
+        vol.Optional("confirm", default=False): cv.boolean,
+        vol.Optional("force", default=False): cv.boolean,
+    }
+)
+
+RESTART_FLEET_SCHEMA = vol.Schema(
+    {
+        vol.Required("fleet_id"): vol.Coerce(int),
+        vol.Optional("service_name"): cv.string,
+        vol.Optional("confirm", default=False): cv.boolean,
+    }
+)
+
+GET_FLEET_HEALTH_SCHEMA = vol.Schema(
+    {
+        vol.Required("fleet_id"): vol.Coerce(int),
+    }
+)
+
+
+BulkTarget = Tuple[BalenaCloudDataUpdateCoordinator, BalenaDevice]
+
+
+def _assess_health(device: BalenaDevice) -> str:
+    """Classify a device for fleet health reports.
+
+    Offline devices are critical; online devices use the health assessed at
+    the last refresh, with no metrics counting as healthy.
+    """
+    if not device.is_online:
+        return "critical"
+    if (health := device.health_status) == "unknown":
+        return "healthy"
+    return health
+
 
 class BalenaCloudServiceHandler:
     """Handler for Balena Cloud services."""
@@ -61,98 +123,112 @@ class BalenaCloudServiceHandler:
         """Initialize the service handler."""
         self.hass = hass
         self._coordinators: Dict[str, BalenaCloudDataUpdateCoordinator] = {}
+        self._device_index: Dict[str, BalenaCloudDataUpdateCoordinator] = {}
+        self._unsub_listeners: Dict[str, Callable[[], None]] = {}
+        self._bulk_semaphore: asyncio.Semaphore | None = None
+        self._registered = False
 
     def register_coordinator(
         self, entry_id: str, coordinator: BalenaCloudDataUpdateCoordinator
     ) -> None:
         """Register a coordinator for service calls."""
+        self.unregister_coordinator(entry_id)
         self._coordinators[entry_id] = coordinator
+        self._index_devices(coordinator)
+        self._unsub_listeners[entry_id] = coordinator.async_add_listener(
+            partial(self._handle_coordinator_update, coordinator)
+        )
 
     def unregister_coordinator(self, entry_id: str) -> None:
         """Unregister a coordinator."""
-        self._coordinators.pop(entry_id, None)
+        if (unsub := self._unsub_listeners.pop(entry_id, None)) is not None:
+            unsub()
+        if (coordinator := self._coordinators.pop(entry_id, None)) is not None:
+            self._drop_devices(coordinator)
+
+    @callback
+    def _handle_coordinator_update(
+        self, coordinator: BalenaCloudDataUpdateCoordinator
+    ) -> None:
+        """Re-index a coordinator's devices after it refreshes."""
+        self._drop_devices(coordinator)
+        self._index_devices(coordinator)
+
+    def _index_devices(self, coordinator: BalenaCloudDataUpdateCoordinator) -> None:
+        """Map each of the coordinator's device UUIDs to the coordinator."""
+        self._device_index.update(dict.fromkeys(coordinator.devices, coordinator))
+
+    def _drop_devices(self, coordinator: BalenaCloudDataUpdateCoordinator) -> None:
+        """Remove the coordinator's devices from the device index."""
+        self._device_index = {
+            device_uuid: indexed
+            for device_uuid, indexed in self._device_index.items()
+            if indexed is not coordinator
+        }
 
     def get_coordinator_for_device(
         self, device_uuid: str
     ) -> BalenaCloudDataUpdateCoordinator | None:
         """Get the coordinator that manages a specific device."""
-        for coordinator in self._coordinators.values():
-            if device_uuid in coordinator.devices:
-                return coordinator
-        return None
+        return self._device_index.get(device_uuid)
+
+    def _get_all_coordinators(
+        self,
+    ) -> ValuesView[BalenaCloudDataUpdateCoordinator]:
+        """Get a live view of all registered coordinators."""
+        return self._coordinators.values()
 
     async def async_setup_services(self) -> None:
         """Set up services for the integration."""
+        if self._registered:
+            return
+
         _LOGGER.debug("Setting up Balena Cloud services")
 
         # Register all services
-        services = [
-            (
-                SERVICE_RESTART_APPLICATION,
-                self._handle_restart_application,
-                RESTART_APPLICATION_SCHEMA,
-            ),
-            (SERVICE_REBOOT_DEVICE, self._handle_reboot_device, REBOOT_DEVICE_SCHEMA),
-            (
-                SERVICE_SHUTDOWN_DEVICE,
-                self._handle_shutdown_device,
-                SHUTDOWN_DEVICE_SCHEMA,
-            ),
-            (
-                SERVICE_UPDATE_ENVIRONMENT,
-                self._handle_update_environment,
-                UPDATE_ENVIRONMENT_SCHEMA,
-            ),
-            (
-                SERVICE_ENABLE_DEVICE_URL,
-                self._handle_enable_device_url,
-                DEVICE_URL_SCHEMA,
-            ),
-            (
-                SERVICE_DISABLE_DEVICE_URL,
-                self._handle_disable_device_url,
-                DEVICE_URL_SCHEMA,
-            ),
-        ]
-
-        for service_name, handler, schema in services:
+        for service_name, (handler, schema) in _SERVICES.items():
             if not self.hass.services.has_service(DOMAIN, service_name):
                 self.hass.services.async_register(
-                    DOMAIN, service_name, handler, schema=schema
+                    DOMAIN,
+                    service_name,
+                    MethodType(handler, self),
+                    schema=schema,
                 )
 
+        self._registered = True
         _LOGGER.info("Balena Cloud services registered")
 
     async def async_remove_services(self) -> None:
-        """Remove services for the integration."""
-        _LOGGER.debug("Removing Balena Cloud services")
+        """Remove services once no config entry uses them any more."""
+        if self._coordinators or not self._registered:
+            return
 
-        services = [
-            SERVICE_RESTART_APPLICATION,
-            SERVICE_REBOOT_DEVICE,
-            SERVICE_SHUTDOWN_DEVICE,
-            SERVICE_UPDATE_ENVIRONMENT,
-            SERVICE_ENABLE_DEVICE_URL,
-            SERVICE_DISABLE_DEVICE_URL,
-        ]
+        _LOGGER.debug("Removing Balena Cloud services")
 
-        for service_name in services:
-            if self.hass.services.has_service(DOMAIN, service_name):
-                self.hass.services.async_remove(DOMAIN, service_name)
+        for service_name in _SERVICES:
+            self.hass.services.async_remove(DOMAIN, service_name)
 
+        self._registered = False
         _LOGGER.info("Balena Cloud services removed")
 
+    def _resolve(
+        self, call: ServiceCall
+    ) -> Tuple[BalenaCloudDataUpdateCoordinator, str] | None:
+        """Resolve a per-device service call to its coordinator and UUID."""
+        device_uuid = call.data["device_uuid"]
+        if (coordinator := self.get_coordinator_for_device(device_uuid)) is None:
+            _LOGGER.error("No coordinator found for device %s", device_uuid)
+            return None
+        return coordinator, device_uuid
+
     async def _handle_restart_application(self, call: ServiceCall) -> None:
         """Handle restart application service call."""
-        device_uuid = call.data["device_uuid"]
+        if not (resolved := self._resolve(call)):
+            return
+        coordinator, device_uuid = resolved
         service_name = call.data.get("service_name")
         # force is not used but kept for schema compatibility
 
-        coordinator = self.get_coordinator_for_device(device_uuid)
-        if not coordinator:
-            _LOGGER.error("No coordinator found for device %s", device_uuid)
-            return
-
         try:
             _LOGGER.info(
                 "Restarting application on device %s (service: %s)",
@@ -178,13 +254,10 @@ class BalenaCloudServiceHandler:
 
     async def _handle_reboot_device(self, call: ServiceCall) -> None:
         """Handle reboot device service call."""
-        device_uuid = call.data["device_uuid"]
-        # force is not used but kept for schema compatibility
-
-        coordinator = self.get_coordinator_for_device(device_uuid)
-        if not coordinator:
-            _LOGGER.error("No coordinator found for device %s", device_uuid)
+        if not (resolved := self._resolve(call)):
             return
+        coordinator, device_uuid = resolved
+        # force is not used but kept for schema compatibility
 
         try:
             _LOGGER.info("Rebooting device %s", device_uuid)
@@ -201,13 +274,10 @@ class BalenaCloudServiceHandler:
 
     async def _handle_shutdown_device(self, call: ServiceCall) -> None:
         """Handle shutdown device service call."""
-        device_uuid = call.data["device_uuid"]
-        # force is not used but kept for schema compatibility
-
-        coordinator = self.get_coordinator_for_device(device_uuid)
-        if not coordinator:
-            _LOGGER.error("No coordinator found for device %s", device_uuid)
+        if not (resolved := self._resolve(call)):
             return
+        coordinator, device_uuid = resolved
+        # force is not used but kept for schema compatibility
 
         try:
             _LOGGER.info("Shutting down device %s", device_uuid)
@@ -226,13 +296,10 @@ class BalenaCloudServiceHandler:
 
     async def _handle_update_environment(self, call: ServiceCall) -> None:
         """Handle update environment variables service call."""
-        device_uuid = call.data["device_uuid"]
-        variables = call.data["variables"]
-
-        coordinator = self.get_coordinator_for_device(device_uuid)
-        if not coordinator:
-            _LOGGER.error("No coordinator found for device %s", device_uuid)
+        if not (resolved := self._resolve(call)):
             return
+        coordinator, device_uuid = resolved
+        variables = call.data["variables"]
 
         try:
             _LOGGER.info(
@@ -264,12 +331,9 @@ class BalenaCloudServiceHandler:
 
     async def _handle_enable_device_url(self, call: ServiceCall) -> None:
         """Handle enable device URL service call."""
-        device_uuid = call.data["device_uuid"]
-
-        coordinator = self.get_coordinator_for_device(device_uuid)
-        if not coordinator:
-            _LOGGER.error("No coordinator found for device %s", device_uuid)
+        if not (resolved := self._resolve(call)):
             return
+        coordinator, device_uuid = resolved
 
         try:
             _LOGGER.info("Enabling device URL for device %s", device_uuid)
@@ -290,12 +354,9 @@ class BalenaCloudServiceHandler:
 
     async def _handle_disable_device_url(self, call: ServiceCall) -> None:
         """Handle disable device URL service call."""
-        device_uuid = call.data["device_uuid"]
-
-        coordinator = self.get_coordinator_for_device(device_uuid)
-        if not coordinator:
-            _LOGGER.error("No coordinator found for device %s", device_uuid)
+        if not (resolved := self._resolve(call)):
             return
+        coordinator, device_uuid = resolved
 
         try:
             _LOGGER.info("Disabling device URL for device %s", device_uuid)
@@ -314,17 +375,281 @@ class BalenaCloudServiceHandler:
                 "Error disabling device URL for device %s: %s", device_uuid, err
             )
 
+    def _collect_bulk_targets(
+        self, device_uuids: List[str] | None, fleet_id: int | None
+    ) -> List[BulkTarget]:
+        """Resolve bulk service targets from device UUIDs or a fleet ID."""
+        targets: List[BulkTarget] = []
+
+        if device_uuids:
+            # Drop duplicate UUIDs so no device gets the same API call twice
+            for device_uuid in dict.fromkeys(device_uuids):
+                coordinator = self.get_coordinator_for_device(device_uuid)
+                device = coordinator.get_device(device_uuid) if coordinator else None
+                if device is None:
+                    _LOGGER.warning("Device %s not found, skipping", device_uuid)
+                    continue
+                targets.append((coordinator, device))
+        else:
+            for coordinator in self._get_all_coordinators():
+                for device in coordinator.get_devices_by_fleet(fleet_id):
+                    targets.append((coordinator, device))
+
+        return targets
+
+    async def _async_run_bulk(
+        self,
+        action: str,
+        targets: List[BulkTarget],
+        operation: Callable[
+            [BalenaCloudDataUpdateCoordinator, BalenaDevice], Awaitable[bool]
+        ],
+    ) -> None:
+        """Run an operation on all online targets with bounded concurrency."""
+        if self._bulk_semaphore is None:
+            self._bulk_semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        semaphore = self._bulk_semaphore
+
+        async def _run_one(
+            coordinator: BalenaCloudDataUpdateCoordinator, device: BalenaDevice
+        ) -> bool:
+            async with semaphore:
+                _LOGGER.debug("Starting %s of device %s", action, device.display_name)
+                return await operation(coordinator, device)
+
+        online_targets = [
+            (coordinator, device) for coordinator, device in targets if device.is_online
+        ]
+        results = await asyncio.gather(
+            *(_run_one(coordinator, device) for coordinator, device in online_targets),
+            return_exceptions=True,
+        )
+
+        succeeded = 0
+        for (_, device), result in zip(online_targets, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Error during %s of device %s: %s",
+                    action,
+                    device.display_name,
+                    result,
+                )
+            elif result:
+                succeeded += 1
+            else:
+                _LOGGER.error("Failed %s of device %s", action, device.display_name)
+
+        _LOGGER.info(
+            "Bulk %s completed: %d succeeded, %d failed, %d offline skipped",
+            action,
+            succeeded,
+            len(online_targets) - succeeded,
+            len(targets) - len(online_targets),
+        )
+
+    async def _handle_bulk_restart(self, call: ServiceCall) -> None:
+        """Handle bulk restart service call."""
+        if not call.data.get("confirm"):
+            _LOGGER.warning("Bulk restart requires confirmation. Use confirm=true")
+            return
+
+        device_uuids = call.data.get("device_uuids")
+        fleet_id = call.data.get("fleet_id")
+        if not device_uuids and not fleet_id:
+            _LOGGER.error("Either device_uuids or fleet_id must be specified")
+            return
+
+        service_name = call.data.get("service_name")
+
+        targets = self._collect_bulk_targets(device_uuids, fleet_id)
+        _LOGGER.info(
+            "Restarting applications on %d devices (service: %s)",
+            len(targets),
+            service_name or "all",
+        )
+
+        await self._async_run_bulk(
+            "restart",
+            targets,
+            lambda coordinator, device: coordinator.async_restart_application(
+                device.uuid, service_name
+            ),
+        )
+
+    async def _handle_bulk_reboot(self, call: ServiceCall) -> None:
+        """Handle bulk reboot service call."""
+        if not call.data.get("confirm"):
+            _LOGGER.warning("Bulk reboot requires confirmation. Use confirm=true")
+            return
+
+        device_uuids = call.data.get("device_uuids")
+        fleet_id = call.data.get("fleet_id")
+        # force is not used but kept for schema compatibility
+        if not device_uuids and not fleet_id:
+            _LOGGER.error("Either device_uuids or fleet_id must be specified")
+            return
+
+        targets = self._collect_bulk_targets(device_uuids, fleet_id)
+        _LOGGER.info("Rebooting %d devices", len(targets))
+
+        await self._async_run_bulk(
+            "reboot",
+            targets,
+            lambda coordinator, device: coordinator.async_reboot_device(device.uuid),
+        )
+
+    async def _handle_restart_fleet(self, call: ServiceCall) -> None:
+        """Handle restart fleet service call."""
+        fleet_id = call.data["fleet_id"]
+        if not call.data.get("confirm"):
+            _LOGGER.warning(
+                "Restarting fleet %s requires confirmation. Use confirm=true", fleet_id
+            )
+            return
+
+        service_name = call.data.get("service_name")
+
+        targets: List[BulkTarget] = []
+        fleet_name = None
+        fleet_owner: BalenaCloudDataUpdateCoordinator | None = None
+        for coordinator in self._get_all_coordinators():
+            if fleet_owner is None and (fleet := coordinator.get_fleet(fleet_id)):
+                fleet_name = fleet.display_name
+                fleet_owner = coordinator
+            targets.extend(
+                (coordinator, device)
+                for device in coordinator.get_devices_by_fleet(fleet_id)
+            )
+
+        if not targets:
+            _LOGGER.error("No devices found in fleet %s", fleet_id)
+            return
+
+        _LOGGER.info(
+            "Restarting applications on fleet %s (%d devices, service: %s)",
+            fleet_name or fleet_id,
+            len(targets),
+            service_name or "all",
+        )
+
+        # A full application restart is a single fleet-level API call; the
+        # API has no fleet-wide equivalent for restarting one service.
+        if service_name is None and fleet_owner is not None:
+            try:
+                if await fleet_owner.async_restart_fleet(fleet_id):
+                    _LOGGER.info("Successfully restarted fleet %s", fleet_name)
+                else:
+                    _LOGGER.error("Failed to restart fleet %s", fleet_name)
+            except Exception as err:
+                _LOGGER.error("Error restarting fleet %s: %s", fleet_name, err)
+            return
+
+        await self._async_run_bulk(
+            "restart",
+            targets,
+            lambda coordinator, device: coordinator.async_restart_application(
+                device.uuid, service_name
+            ),
+        )
+
+    async def _handle_get_fleet_health(self, call: ServiceCall) -> None:
+        """Handle get fleet health service call."""
+        fleet_id = call.data["fleet_id"]
+
+        fleet_name = None
+        device_details: List[Dict[str, Any]] = []
+        for coordinator in self._get_all_coordinators():
+            if fleet_name is None and (fleet := coordinator.get_fleet(fleet_id)):
+                fleet_name = fleet.display_name
+            device_details.extend(
+                {
+                    "uuid": device.uuid,
+                    "name": device.display_name,
+                    "health": _assess_health(device),
+                    "online": device.is_online,
+                    "status": device.status,
+                }
+                for device in coordinator.get_devices_by_fleet(fleet_id)
+            )
 
-# Global service handler instance
-_service_handler: BalenaCloudServiceHandler | None = None
+        # Count from the detail records so each device attribute is read once
+        counts = Counter(detail["health"] for detail in device_details)
+        health_data: Dict[str, Any] = {
+            "fleet_id": fleet_id,
+            "fleet_name": fleet_name,
+            "total_devices": len(device_details),
+            "online_devices": sum(detail["online"] for detail in device_details),
+            "healthy_devices": counts["healthy"],
+            "warning_devices": counts["warning"],
+            "critical_devices": counts["critical"],
+            "device_details": device_details,
+        }
+
+        _LOGGER.info(
+            "Fleet %s health: %d healthy, %d warning, %d critical of %d devices",
+            fleet_name or fleet_id,
+            health_data["healthy_devices"],
+            health_data["warning_devices"],
+            health_data["critical_devices"],
+            health_data["total_devices"],
+        )
+
+        self.hass.bus.async_fire(EVENT_FLEET_HEALTH_RESPONSE, health_data)
+
+
+_ServiceHandlerFn = Callable[[BalenaCloudServiceHandler, ServiceCall], Awaitable[None]]
+
+# Handler and schema per service, bound to the handler instance on registration
+_SERVICES: Dict[str, Tuple[_ServiceHandlerFn, vol.Schema]] = {
+    SERVICE_RESTART_APPLICATION: (
+        BalenaCloudServiceHandler._handle_restart_application,
+        RESTART_APPLICATION_SCHEMA,
+    ),
+    SERVICE_REBOOT_DEVICE: (
+        BalenaCloudServiceHandler._handle_reboot_device,
+        REBOOT_DEVICE_SCHEMA,
+    ),
+    SERVICE_SHUTDOWN_DEVICE: (
+        BalenaCloudServiceHandler._handle_shutdown_device,
+        SHUTDOWN_DEVICE_SCHEMA,
+    ),
+    SERVICE_UPDATE_ENVIRONMENT: (
+        BalenaCloudServiceHandler._handle_update_environment,
+        UPDATE_ENVIRONMENT_SCHEMA,
+    ),
+    SERVICE_ENABLE_DEVICE_URL: (
+        BalenaCloudServiceHandler._handle_enable_device_url,
+        DEVICE_URL_SCHEMA,
+    ),
+    SERVICE_DISABLE_DEVICE_URL: (
+        BalenaCloudServiceHandler._handle_disable_device_url,
+        DEVICE_URL_SCHEMA,
+    ),
+    SERVICE_BULK_RESTART: (
+        BalenaCloudServiceHandler._handle_bulk_restart,
+        BULK_RESTART_SCHEMA,
+    ),
+    SERVICE_BULK_REBOOT: (
+        BalenaCloudServiceHandler._handle_bulk_reboot,
+        BULK_REBOOT_SCHEMA,
+    ),
+    SERVICE_RESTART_FLEET: (
+        BalenaCloudServiceHandler._handle_restart_fleet,
+        RESTART_FLEET_SCHEMA,
+    ),
+    SERVICE_GET_FLEET_HEALTH: (
+        BalenaCloudServiceHandler._handle_get_fleet_health,
+        GET_FLEET_HEALTH_SCHEMA,
+    ),
+}
 
 
 def get_service_handler(hass: HomeAssistant) -> BalenaCloudServiceHandler:
-    """Get the global service handler instance."""
-    global _service_handler
-    if _service_handler is None:
-        _service_handler = BalenaCloudServiceHandler(hass)
-    return _service_handler
+    """Get the service handler shared by all entries of this hass instance."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if SERVICE_HANDLER_KEY not in domain_data:
+        domain_data[SERVICE_HANDLER_KEY] = BalenaCloudServiceHandler(hass)
+    return domain_data[SERVICE_HANDLER_KEY]
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
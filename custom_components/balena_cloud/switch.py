@@ -8,9 +8,7 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTR_DEVICE_NAME,
@@ -20,8 +18,8 @@ from .const import (
     DOMAIN,
 )
 from .coordinator import BalenaCloudDataUpdateCoordinator
-from .device_registry import async_ensure_fleet_device
-from .models import BalenaDevice
+from .device_registry import async_ensure_fleet_devices
+from .entity import BalenaCloudDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,8 +35,9 @@ async def async_setup_entry(
     ]
 
     # Ensure fleet devices exist in the device registry
-    for fleet in coordinator.fleets.values():
-        await async_ensure_fleet_device(hass, fleet, config_entry.entry_id)
+    async_ensure_fleet_devices(
+        hass, coordinator.fleets.values(), config_entry.entry_id
+    )
 
     # Track known devices to avoid duplicates
     known_devices: set[str] = set()
@@ -47,26 +46,23 @@ async def async_setup_entry(
     def _check_for_new_devices() -> None:
         """Check for new devices and add entities for them."""
         # Ensure fleet devices exist for newly discovered fleets
-        for fleet in coordinator.fleets.values():
-            if fleet.id not in known_fleets:
-                known_fleets.add(fleet.id)
-                hass.async_create_task(
-                    async_ensure_fleet_device(hass, fleet, config_entry.entry_id)
-                )
-
-        new_switches: list[BalenaCloudPublicUrlSwitch] = []
-
-        for device_uuid, device in coordinator.devices.items():
-            if device_uuid not in known_devices:
-                known_devices.add(device_uuid)
-                new_switches.append(
-                    BalenaCloudPublicUrlSwitch(
-                        coordinator=coordinator,
-                        device_uuid=device_uuid,
-                    )
-                )
+        new_fleets = [
+            fleet
+            for fleet in coordinator.fleets.values()
+            if fleet.id not in known_fleets
+        ]
+        if new_fleets:
+            known_fleets.update(fleet.id for fleet in new_fleets)
+            async_ensure_fleet_devices(hass, new_fleets, config_entry.entry_id)
+
+        new_switches: list[BalenaCloudPublicUrlSwitch] = [
+            BalenaCloudPublicUrlSwitch(coordinator=coordinator, device_uuid=device_uuid)
+            for device_uuid in coordinator.devices
+            if device_uuid not in known_devices
+        ]
 
         if new_switches:
+            known_devices.update(switch._device_uuid for switch in new_switches)
             async_add_entities(new_switches)
 
     # Check for devices initially
@@ -78,9 +74,7 @@ async def async_setup_entry(
     )
 
 
-class BalenaCloudPublicUrlSwitch(
-    CoordinatorEntity[BalenaCloudDataUpdateCoordinator], SwitchEntity
-):
+class BalenaCloudPublicUrlSwitch(BalenaCloudDeviceEntity, SwitchEntity):
     """Toggle for device public URL."""
 
     def __init__(
@@ -89,36 +83,25 @@ class BalenaCloudPublicUrlSwitch(
         device_uuid: str,
     ) -> None:
         """Initialize the public URL switch."""
-        super().__init__(coordinator)
-        self._device_uuid = device_uuid
+        super().__init__(coordinator, device_uuid)
         self._attr_unique_id = f"{device_uuid}_public_url"
         self._attr_name = "Public URL"
         self._attr_icon = "mdi:web"
-        self._cached_url = None
-
-    @property
-    def device(self) -> BalenaDevice | None:
-        """Return the device."""
-        return self.coordinator.get_device(self._device_uuid)
+        self._optimistic_state: bool | None = None
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return super().available and self.device is not None
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        if self.device:
-            return f"{self.device.display_name} Public URL"
-        return "Unknown Device Public URL"
-
     @property
     def is_on(self) -> bool | None:
         """Return true if public URL is enabled."""
-        # We determine this by checking if we can get a URL
-        # This will be updated during coordinator refresh
-        return self._cached_url is not None
+        # Set optimistically when enabled until the background URL fetch
+        # finishes
+        if self._optimistic_state is not None:
+            return self._optimistic_state
+        return self.coordinator.device_urls.get(self._device_uuid) is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable public device URL."""
@@ -131,15 +114,19 @@ class BalenaCloudPublicUrlSwitch(
         try:
             success = await self.coordinator.async_enable_device_url(self._device_uuid)
             if success:
-                # Get the URL and cache it
-                url = await self.coordinator.async_get_device_url(self._device_uuid)
-                self._cached_url = url
                 _LOGGER.info(
-                    "Successfully enabled public URL for device %s: %s",
+                    "Successfully enabled public URL for device %s",
                     self.device.display_name,
-                    url or "URL not immediately available"
                 )
+                # Show the switch as on right away and fetch the URL itself
+                # in the background; the task is cancelled on unload
+                self._optimistic_state = True
                 self.async_write_ha_state()
+                self.coordinator.entry.async_create_background_task(
+                    self.hass,
+                    self._async_fetch_url(),
+                    f"{DOMAIN} public URL fetch for {self._device_uuid}",
+                )
             else:
                 _LOGGER.error(
                     "Failed to enable public URL for device %s",
@@ -163,7 +150,8 @@ class BalenaCloudPublicUrlSwitch(
         try:
             success = await self.coordinator.async_disable_device_url(self._device_uuid)
             if success:
-                self._cached_url = None
+                # The coordinator has already cleared the URL
+                self._optimistic_state = None
                 _LOGGER.info(
                     "Successfully disabled public URL for device %s",
                     self.device.display_name,
@@ -181,40 +169,26 @@ class BalenaCloudPublicUrlSwitch(
                 err,
             )
 
-    async def async_update(self) -> None:
-        """Update the switch state by checking current URL."""
+    async def _async_fetch_url(self) -> None:
+        """Fetch the newly enabled URL into the coordinator cache."""
         try:
-            url = await self.coordinator.async_get_device_url(self._device_uuid)
-            self._cached_url = url
+            await self.coordinator.async_get_device_url(self._device_uuid)
         except Exception as err:
-            _LOGGER.debug("Could not update public URL state for %s: %s", self._device_uuid, err)
-            # Don't change cached state on error
+            _LOGGER.debug("Could not fetch public URL for %s: %s", self._device_uuid, err)
+        finally:
+            self._optimistic_state = None
+        self.async_write_ha_state()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
+        device = self.device
         attrs = {
-            ATTR_DEVICE_UUID: self.device.uuid if self.device else None,
-            ATTR_DEVICE_NAME: self.device.device_name if self.device else None,
-            ATTR_DEVICE_TYPE: self.device.device_type if self.device else None,
-            ATTR_FLEET_NAME: self.device.fleet_name if self.device else None,
+            ATTR_DEVICE_UUID: device.uuid if device else None,
+            ATTR_DEVICE_NAME: device.device_name if device else None,
+            ATTR_DEVICE_TYPE: device.device_type if device else None,
+            ATTR_FLEET_NAME: device.fleet_name if device else None,
         }
-        if self._cached_url:
-            attrs["public_url"] = self._cached_url
+        if url := self.coordinator.device_urls.get(self._device_uuid):
+            attrs["public_url"] = url
         return {k: v for k, v in attrs.items() if v is not None}
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info."""
-        if not (device := self.device):
-            return None
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, device.uuid)},
-            name=device.display_name,
-            manufacturer="Balena",
-            model=device.device_type,
-            sw_version=device.os_version,
-            configuration_url=f"https://dashboard.balena-cloud.com/devices/{device.uuid}",
-            via_device=(DOMAIN, f"fleet_{device.fleet_id}"),
-        )
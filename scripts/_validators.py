@@ -0,0 +1,91 @@
+"""Shared validation helpers for the Balena Cloud release scripts."""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    # Optional faster parser; its JSONDecodeError subclasses json's
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+MANIFEST_PATH = Path("custom_components/balena_cloud/manifest.json")
+
+# Manifest fields that HACS allows
+HACS_ALLOWED_FIELDS = frozenset({
+    "domain", "name", "codeowners", "config_flow", "dependencies",
+    "documentation", "integration_type", "iot_class", "issue_tracker",
+    "loggers", "requirements", "version"
+})
+
+
+@lru_cache(maxsize=None)
+def _parse_manifest(path, mtime_ns):
+    """Parse a manifest file; mtime_ns is only part of the cache key."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Load a manifest, parsing it once until the file is modified."""
+    return _parse_manifest(str(path), path.stat().st_mtime_ns)
+
+
+def validate_manifest():
+    """Validate manifest.json."""
+    print("🔍 Validating manifest.json...")
+
+    try:
+        manifest = load_manifest()
+
+        # Check for invalid fields that HACS doesn't allow
+        invalid_fields = sorted(manifest.keys() - HACS_ALLOWED_FIELDS)
+
+        if invalid_fields:
+            print(f"❌ Invalid manifest fields: {invalid_fields}")
+            print("These fields are not allowed in Home Assistant manifests:")
+            for field in invalid_fields:
+                print(f"  - {field}: {manifest[field]}")
+            return False
+
+        print("✅ manifest.json validation - PASSED")
+        return True
+
+    except FileNotFoundError:
+        print("❌ manifest.json not found!")
+        return False
+    except json.JSONDecodeError as e:
+        print(f"❌ Invalid JSON in manifest.json: {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Error validating manifest.json: {e}")
+        return False
+
+
+def validate_services():
+    """Check if services.yaml is needed."""
+    print("🔍 Checking services configuration...")
+
+    # Check if services.py registers any services
+    services_path = Path("custom_components/balena_cloud/services.py")
+    try:
+        with open(services_path) as f:
+            # Stop reading at the first registration
+            registers_services = any("async_register" in line for line in f)
+    except FileNotFoundError:
+        registers_services = False
+
+    if registers_services:
+        # Services are registered in code, check if services.yaml exists
+        services_yaml = Path("custom_components/balena_cloud/services.yaml")
+        if not services_yaml.exists():
+            print("❌ Integration registers services but services.yaml is missing!")
+            print("Creating services.yaml file...")
+            return False
+        else:
+            print("✅ Services validation - PASSED")
+            return True
+
+    print("✅ No services registered - PASSED")
+    return True
@@ -9,30 +9,25 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from _validators import MANIFEST_PATH, load_manifest
+
+SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
 
 def get_current_version():
     """Get current version from manifest.json."""
-    manifest_path = Path("custom_components/balena_cloud/manifest.json")
-    if not manifest_path.exists():
+    if not MANIFEST_PATH.exists():
         print("❌ manifest.json not found!")
         sys.exit(1)
 
-    with open(manifest_path) as f:
-        manifest = json.load(f)
-
-    return manifest.get("version", "0.0.0")
+    return load_manifest().get("version", "0.0.0")
 
 
 def update_version(new_version):
     """Update version in manifest.json."""
-    manifest_path = Path("custom_components/balena_cloud/manifest.json")
-
-    with open(manifest_path) as f:
-        manifest = json.load(f)
+    manifest = {**load_manifest(), "version": new_version}
 
-    manifest["version"] = new_version
-
-    with open(manifest_path, "w") as f:
+    with open(MANIFEST_PATH, "w") as f:
         json.dump(manifest, f, indent=2)
         f.write("\n")
 
@@ -41,8 +36,7 @@ def update_version(new_version):
 
 def validate_version_format(version):
     """Validate semantic version format."""
-    pattern = r"^\d+\.\d+\.\d+$"
-    if not re.match(pattern, version):
+    if not SEMVER_RE.match(version):
         print(f"❌ Invalid version format: {version}")
         print("Version should be in format: MAJOR.MINOR.PATCH (e.g., 1.0.0)")
         return False
@@ -53,20 +47,24 @@ def run_tests():
     """Run the test suite."""
     print("🧪 Running test suite...")
     try:
-        result = subprocess.run(
+        # Stream output as it is produced instead of buffering the whole run
+        with subprocess.Popen(
             ["python", "tests/test_runner.py"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
+            bufsize=1,
             cwd=Path.cwd()
-        )
+        ) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+            returncode = proc.wait()
 
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ All tests passed!")
             return True
         else:
             print("❌ Tests failed!")
-            print(result.stdout)
-            print(result.stderr)
             return False
     except Exception as e:
         print(f"❌ Error running tests: {e}")
@@ -101,18 +99,15 @@ def generate_changelog(version):
         with open(changelog_path) as f:
             existing_content = f.read()
 
-        # Insert new entry after the header
-        lines = existing_content.split('\n')
-        header_end = 0
-        for i, line in enumerate(lines):
-            if line.startswith('## '):
-                header_end = i
-                break
-
-        lines.insert(header_end, changelog_entry.strip())
+        # Insert new entry after the header, before the first release heading
+        head, sep, tail = existing_content.partition('\n## ')
+        if sep:
+            new_content = f"{head}\n{changelog_entry.strip()}\n## {tail}"
+        else:
+            new_content = f"{changelog_entry.strip()}\n{existing_content}"
 
         with open(changelog_path, "w") as f:
-            f.write('\n'.join(lines))
+            f.write(new_content)
     else:
         with open(changelog_path, "w") as f:
             f.write(f"# Changelog\n\nAll notable changes to this project will be documented in this file.\n{changelog_entry}")
@@ -147,9 +142,7 @@ def validate_integration():
     print("🔍 Validating integration...")
 
     # Check manifest.json
-    manifest_path = Path("custom_components/balena_cloud/manifest.json")
-    with open(manifest_path) as f:
-        manifest = json.load(f)
+    manifest = load_manifest()
 
     required_fields = ["domain", "name", "version", "requirements", "dependencies"]
     for field in required_fields:
@@ -1,165 +1,244 @@
 """Test configuration and fixtures for Balena Cloud integration tests."""
 from __future__ import annotations
 
-from typing import Any, Dict
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import copy
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
-from aiohttp import ClientSession
-from homeassistant.core import HomeAssistant
-from homeassistant.setup import async_setup_component
 import pytest_asyncio
 
-from custom_components.balena_cloud.const import DOMAIN
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="skip tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run slow tests after everything else, or skip them with --skip-slow."""
+    if config.getoption("--skip-slow"):
+        skip_slow = pytest.mark.skip(reason="skipped with --skip-slow")
+        for item in items:
+            if "slow" in item.keywords:
+                item.add_marker(skip_slow)
+    # sort() is stable, so the collection order is kept within each group
+    items.sort(key=lambda item: "slow" in item.keywords)
+
+
+# Static data fixtures (API responses, the config entry, automations and
+# performance data) are shared by every test. Their top level is a
+# MappingProxyType; tests must treat them as read-only.
+
+_API_RESPONSE = MappingProxyType({
+    "user": {
+        "id": 12345,
+        "username": "test_user",
+        "email": "test@example.com",
+    },
+    "fleets": [
+        {
+            "id": 1001,
+            "app_name": "test-fleet-1",
+            "slug": "test_user/test-fleet-1",
+            "device_type": "raspberrypi4-64",
+            "created_at": "2024-01-01T00:00:00.000Z",
+        },
+        {
+            "id": 1002,
+            "app_name": "test-fleet-2",
+            "slug": "test_user/test-fleet-2",
+            "device_type": "jetson-orin-nano-devkit",
+            "created_at": "2024-01-02T00:00:00.000Z",
+        },
+    ],
+    "devices": [
+        {
+            "id": 2001,
+            "uuid": "device-uuid-1",
+            "device_name": "test-device-1",
+            "device_type": "raspberrypi4-64",
+            "belongs_to__application": {"__id": 1001, "app_name": "test-fleet-1"},
+            "is_online": True,
+            "status": "Idle",
+            "ip_address": "192.168.1.100",
+            "mac_address": "b8:27:eb:12:34:56",
+            "os_version": "balenaOS 2024.1.1",
+            "supervisor_version": "14.13.5",
+            "last_connectivity_event": "2024-01-15T10:30:00.000Z",
+            "created_at": "2024-01-01T12:00:00.000Z",
+        },
+        {
+            "id": 2002,
+            "uuid": "device-uuid-2",
+            "device_name": "test-device-2",
+            "device_type": "jetson-orin-nano-devkit",
+            "belongs_to__application": {"__id": 1002, "app_name": "test-fleet-2"},
+            "is_online": False,
+            "status": "Offline",
+            "ip_address": None,
+            "mac_address": "00:04:4b:12:34:56",
+            "os_version": "balenaOS 2024.1.0",
+            "supervisor_version": "14.13.3",
+            "last_connectivity_event": "2024-01-14T08:15:00.000Z",
+            "created_at": "2024-01-02T14:30:00.000Z",
+        },
+    ],
+    "device_metrics": {
+        "device-uuid-1": {
+            "cpu_usage": 25.5,
+            "memory_usage": 512000000,
+            "memory_total": 2000000000,
+            "storage_usage": 8000000000,
+            "storage_total": 32000000000,
+            "temperature": 45.2,
+        },
+        "device-uuid-2": {
+            "cpu_usage": None,
+            "memory_usage": None,
+            "memory_total": None,
+            "storage_usage": None,
+            "storage_total": None,
+            "temperature": None,
+        },
+    },
+})
 
 
 @pytest.fixture
 def mock_aiohttp_session():
-    """Mock aiohttp ClientSession."""
-    session = AsyncMock(spec=ClientSession)
-    return session
+    """Mock aiohttp ClientSession.
+
+    Unspecced: tests only pass the session through, and specing against
+    ClientSession is several times slower to build.
+    """
+    return AsyncMock()
 
 
 @pytest.fixture
 def mock_balena_api_response():
     """Mock Balena Cloud API responses."""
-    return {
-        "user": {
-            "id": 12345,
-            "username": "test_user",
-            "email": "test@example.com",
-        },
-        "fleets": [
-            {
-                "id": 1001,
-                "app_name": "test-fleet-1",
-                "slug": "test_user/test-fleet-1",
-                "device_type": "raspberrypi4-64",
-                "created_at": "2024-01-01T00:00:00.000Z",
-            },
-            {
-                "id": 1002,
-                "app_name": "test-fleet-2",
-                "slug": "test_user/test-fleet-2",
-                "device_type": "jetson-orin-nano-devkit",
-                "created_at": "2024-01-02T00:00:00.000Z",
-            },
-        ],
-        "devices": [
-            {
-                "id": 2001,
-                "uuid": "device-uuid-1",
-                "device_name": "test-device-1",
-                "device_type": "raspberrypi4-64",
-                "belongs_to__application": {"__id": 1001, "app_name": "test-fleet-1"},
-                "is_online": True,
-                "status": "Idle",
-                "ip_address": "192.168.1.100",
-                "mac_address": "b8:27:eb:12:34:56",
-                "os_version": "balenaOS 2024.1.1",
-                "supervisor_version": "14.13.5",
-                "last_connectivity_event": "2024-01-15T10:30:00.000Z",
-                "created_at": "2024-01-01T12:00:00.000Z",
-            },
-            {
-                "id": 2002,
-                "uuid": "device-uuid-2",
-                "device_name": "test-device-2",
-                "device_type": "jetson-orin-nano-devkit",
-                "belongs_to__application": {"__id": 1002, "app_name": "test-fleet-2"},
-                "is_online": False,
-                "status": "Offline",
-                "ip_address": None,
-                "mac_address": "00:04:4b:12:34:56",
-                "os_version": "balenaOS 2024.1.0",
-                "supervisor_version": "14.13.3",
-                "last_connectivity_event": "2024-01-14T08:15:00.000Z",
-                "created_at": "2024-01-02T14:30:00.000Z",
-            },
-        ],
-        "device_metrics": {
-            "device-uuid-1": {
-                "cpu_usage": 25.5,
-                "memory_usage": 512000000,
-                "memory_total": 2000000000,
-                "storage_usage": 8000000000,
-                "storage_total": 32000000000,
-                "temperature": 45.2,
-            },
-            "device-uuid-2": {
-                "cpu_usage": None,
-                "memory_usage": None,
-                "memory_total": None,
-                "storage_usage": None,
-                "storage_total": None,
-                "temperature": None,
-            },
-        },
-    }
+    return _API_RESPONSE
 
 
 @pytest.fixture
+def mock_balena_api_response_mutable():
+    """Private copy of the mock API responses for tests that modify them."""
+    return copy.deepcopy(dict(_API_RESPONSE))
+
+
+@pytest.fixture(scope="session")
 def mock_config_entry():
     """Mock config entry."""
-    return {
+    return MappingProxyType({
         "entry_id": "test_entry_id",
-        "data": {
+        "data": MappingProxyType({
             "api_token": "test_api_token_12345",
-            "fleets": [1001, 1002],
-        },
-        "options": {
+            "fleets": (1001, 1002),
+        }),
+        "options": MappingProxyType({
             "update_interval": 30,
             "include_offline_devices": True,
-        },
-    }
+        }),
+    })
 
 
 @pytest_asyncio.fixture
 async def mock_integration_setup(hass: HomeAssistant, mock_config_entry):
     """Set up the integration with mocked dependencies."""
+    from custom_components.balena_cloud.const import DOMAIN
 
-    with patch("custom_components.balena_cloud.BalenaCloudAPIClient") as mock_api, \
-         patch("homeassistant.helpers.aiohttp_client.async_get_clientsession") as mock_session:
+    with patch.multiple(
+        "custom_components.balena_cloud.coordinator",
+        BalenaCloudAPIClient=DEFAULT,
+    ) as patched, patch(
+        "homeassistant.helpers.aiohttp_client.async_get_clientsession"
+    ) as mock_session:
 
         # Configure API client mock
         api_instance = AsyncMock()
-        mock_api.return_value = api_instance
+        patched["BalenaCloudAPIClient"].return_value = api_instance
 
         # Configure session mock
-        mock_session.return_value = AsyncMock(spec=ClientSession)
+        mock_session.return_value = AsyncMock()
 
-        # Set up the integration
-        assert await async_setup_component(
-            hass,
-            DOMAIN,
-            {DOMAIN: mock_config_entry["data"]},
-        )
-        await hass.async_block_till_done()
+        # Register a mocked coordinator the way async_setup_entry would,
+        # without going through Home Assistant's component setup
+        coordinator = AsyncMock()
+        coordinator.api = api_instance
+        hass.data.setdefault(DOMAIN, {})[mock_config_entry["entry_id"]] = coordinator
 
         yield {
             "api_client": api_instance,
+            "coordinator": coordinator,
             "session": mock_session.return_value,
         }
 
+        # Drop the child mocks and call records built up during the test
+        hass.data[DOMAIN].pop(mock_config_entry["entry_id"], None)
+        coordinator.reset_mock()
+        api_instance.reset_mock()
+
+
+@pytest_asyncio.fixture
+async def eager_tasks():
+    """Start tasks created during the test eagerly (Python 3.12+).
+
+    gather() over mocked calls then runs each coroutine up to its first
+    real suspension point instead of queueing it on the loop first.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        yield
+        return
+
+    loop = asyncio.get_running_loop()
+    previous_factory = loop.get_task_factory()
+    loop.set_task_factory(eager_task_factory)
+    try:
+        yield
+    finally:
+        loop.set_task_factory(previous_factory)
+
+
+@pytest.fixture
+def http_response_factory():
+    """Factory for mock HTTP responses."""
+
+    def _make(status, body, headers=None):
+        response = MagicMock()
+        response.status = status
+        response.headers = headers or {}
+        response.text = AsyncMock(return_value=body)
+        return response
+
+    return _make
+
 
 @pytest.fixture
-def mock_rate_limit_response():
+def mock_rate_limit_response(http_response_factory):
     """Mock rate limit HTTP response."""
-    response = MagicMock()
-    response.status = 429
-    response.headers = {"X-RateLimit-Reset": "1705398000"}  # Future timestamp
-    response.text = AsyncMock(return_value="Rate limit exceeded")
-    return response
+    return http_response_factory(
+        429,
+        "Rate limit exceeded",
+        {"X-RateLimit-Reset": "1705398000"},  # Future timestamp
+    )
 
 
 @pytest.fixture
-def mock_auth_error_response():
+def mock_auth_error_response(http_response_factory):
     """Mock authentication error HTTP response."""
-    response = MagicMock()
-    response.status = 401
-    response.headers = {}
-    response.text = AsyncMock(return_value="Unauthorized")
-    return response
+    return http_response_factory(401, "Unauthorized")
 
 
 @pytest.fixture
@@ -213,7 +292,10 @@ class MockHomeAssistant:
 @pytest.fixture
 def mock_hass():
     """Provide a mock Home Assistant instance."""
-    return MockHomeAssistant()
+    hass = MockHomeAssistant()
+    yield hass
+    # Release coordinators and other objects tests stored on the instance
+    hass.data.clear()
 
 
 # Alias for the hass fixture that tests expect
@@ -225,43 +307,55 @@ def hass(mock_hass):
 
 @pytest.fixture
 def mock_device():
-    """Mock Balena device for testing."""
-    device = MagicMock()
-    device.uuid = "device-uuid-1"
-    device.display_name = "Test Device 1"
-    device.device_name = "Test Device 1"
-    device.device_type = "raspberrypi4-64"
-    device.fleet_id = 1001
-    device.fleet_name = "test-fleet-1"
-    device.is_online = True
-    device.status = "Idle"
-    device.ip_address = "192.168.1.100"
-    device.mac_address = "b8:27:eb:12:34:56"
-    device.os_version = "balenaOS 2024.1.1"
-    device.supervisor_version = "14.13.5"
-    device.last_connectivity_event = "2024-01-15T10:30:00.000Z"
-    device.created_at = "2024-01-01T12:00:00.000Z"
-
-    # Mock metrics
-    device.metrics = MagicMock()
-    device.metrics.cpu_usage = 25.5
-    device.metrics.cpu_percentage = 25.5
-    device.metrics.memory_usage = 512000000
-    device.metrics.memory_total = 2000000000
-    device.metrics.memory_percentage = 25.6
-    device.metrics.storage_usage = 8000000000
-    device.metrics.storage_total = 32000000000
-    device.metrics.storage_percentage = 25.0
-    device.metrics.temperature = 45.2
+    """Mock Balena device for testing.
+
+    A plain attribute bag: nothing asserts on calls to the device, and a
+    MagicMock would silently invent any attribute an entity reads.
+    """
+    metrics = SimpleNamespace(
+        cpu_usage=25.5,
+        cpu_percentage=25.5,
+        memory_usage=512000000,
+        memory_total=2000000000,
+        memory_percentage=25.6,
+        storage_usage=8000000000,
+        storage_total=32000000000,
+        storage_percentage=25.0,
+        temperature=45.2,
+        temperature_rounded=45.2,
+    )
+
+    return SimpleNamespace(
+        uuid="device-uuid-1",
+        display_name="Test Device 1",
+        device_name="Test Device 1",
+        device_type="raspberrypi4-64",
+        fleet_id=1001,
+        fleet_name="test-fleet-1",
+        is_online=True,
+        status="Idle",
+        ip_address="192.168.1.100",
+        public_address=None,
+        mac_address="b8:27:eb:12:34:56",
+        os_version="balenaOS 2024.1.1",
+        supervisor_version="14.13.5",
+        last_connectivity_event="2024-01-15T10:30:00.000Z",
+        last_seen=None,
+        created_at="2024-01-01T12:00:00.000Z",
+        health_status="healthy",
+        metrics=metrics,
+    )
 
-    return device
+
+# datetime is immutable, so every device can share these.
+_DT_CONNECTED = datetime(2024, 1, 15, 10, 30)
+_DT_CREATED = datetime(2024, 1, 1, 12, 0)
 
 
 @pytest.fixture
 def mock_device_with_metrics():
     """Mock Balena device with metrics for testing."""
     from custom_components.balena_cloud.models import BalenaDevice, BalenaDeviceMetrics
-    from datetime import datetime
 
     # Create the device using the actual model
     device = BalenaDevice(
@@ -276,8 +370,8 @@ def mock_device_with_metrics():
         mac_address="b8:27:eb:12:34:56",
         os_version="balenaOS 2024.1.1",
         supervisor_version="14.13.5",
-        last_connectivity_event=datetime.fromisoformat("2024-01-15T10:30:00"),
-        created_at=datetime.fromisoformat("2024-01-01T12:00:00"),
+        last_connectivity_event=_DT_CONNECTED,
+        created_at=_DT_CREATED,
     )
 
     # Add metrics
@@ -294,23 +388,13 @@ def mock_device_with_metrics():
 
 
 @pytest.fixture
-def mock_coordinator_setup():
-    """Set up mock coordinator for testing."""
-    from custom_components.balena_cloud.coordinator import BalenaCloudDataUpdateCoordinator
-
-    mock_hass = AsyncMock()
+def mock_coordinator_setup(mock_hass):
+    """Set up mock coordinator for testing.
 
-    # Ensure Home Assistant frame helper is set up for DataUpdateCoordinator
-    from homeassistant.helpers import frame as ha_frame
-    import threading, asyncio
-    mock_hass.loop_thread_id = threading.get_ident()
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    mock_hass.loop = loop
-    ha_frame.async_setup(mock_hass)
+    Uses MockHomeAssistant, which already has the loop and frame
+    helper wired up for DataUpdateCoordinator.
+    """
+    from custom_components.balena_cloud.coordinator import BalenaCloudDataUpdateCoordinator
 
     config_data = {
         "api_token": "test_token_12345",
@@ -338,10 +422,10 @@ def mock_coordinator_setup():
     return coordinator, mock_hass, config_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_automation_config():
     """Sample automation configurations for testing."""
-    return {
+    return MappingProxyType({
         "device_offline_alert": {
             "alias": "Balena Device Offline Alert",
             "trigger": {
@@ -380,7 +464,7 @@ def sample_automation_config():
                 "platform": "time_pattern",
                 "hours": "/6",
             },
-            "action": [
+            "action": (
                 {
                     "service": "balena_cloud.get_fleet_health",
                     "data": {"fleet_id": 1001},
@@ -403,12 +487,22 @@ def sample_automation_config():
                         "message": "Fleet has {{ wait.trigger.event.data.critical_devices }} critical devices.",
                     },
                 },
-            ],
+            ),
         },
-    }
+    })
 
 
-@pytest.fixture
+# Fields shared by every generated performance device.
+_PERF_DEVICE_TEMPLATE = {
+    "device_type": "raspberrypi4-64",
+    "os_version": "balenaOS 2024.1.1",
+    "supervisor_version": "14.13.5",
+    "last_connectivity_event": "2024-01-15T10:30:00.000Z",
+    "created_at": "2024-01-01T12:00:00.000Z",
+}
+
+
+@pytest.fixture(scope="session")
 def performance_test_data():
     """Performance test data with large datasets."""
 
@@ -426,86 +520,61 @@ def performance_test_data():
         })
 
         # 20 devices per fleet = 1000 total devices
+        fleet_ref = {"__id": fleet_id, "app_name": f"performance-fleet-{fleet_id}"}
         for device_idx in range(20):
             device_id = fleet_id * 100 + device_idx
-            devices.append({
-                "id": device_id,
-                "uuid": f"perf-device-{device_id}",
-                "device_name": f"performance-device-{device_id}",
-                "device_type": "raspberrypi4-64",
-                "belongs_to__application": {"__id": fleet_id, "app_name": f"performance-fleet-{fleet_id}"},
-                "is_online": device_idx % 4 != 0,  # 75% online rate
-                "status": "Idle" if device_idx % 4 != 0 else "Offline",
-                "ip_address": f"192.168.1.{100 + device_idx}" if device_idx % 4 != 0 else None,
-                "mac_address": f"b8:27:eb:12:{device_idx:02x}:56",
-                "os_version": "balenaOS 2024.1.1",
-                "supervisor_version": "14.13.5",
-                "last_connectivity_event": "2024-01-15T10:30:00.000Z",
-                "created_at": "2024-01-01T12:00:00.000Z",
-            })
-
-    return {
+            online = device_idx % 4 != 0  # 75% online rate
+            device = _PERF_DEVICE_TEMPLATE.copy()
+            device["id"] = device_id
+            device["uuid"] = f"perf-device-{device_id}"
+            device["device_name"] = f"performance-device-{device_id}"
+            device["belongs_to__application"] = fleet_ref
+            device["is_online"] = online
+            device["status"] = "Idle" if online else "Offline"
+            device["ip_address"] = f"192.168.1.{100 + device_idx}" if online else None
+            device["mac_address"] = f"b8:27:eb:12:{device_idx:02x}:56"
+            devices.append(device)
+
+    return MappingProxyType({
         "fleets": fleets,
         "devices": devices,
-    }
+    })
 
 
-@pytest.fixture
-def security_test_scenarios():
-    """Security test scenarios and data."""
-    return {
-        "invalid_tokens": [
-            "",
-            "invalid_token",
-            "expired_token_12345",
-            "malicious_token_<script>",
-            "../../etc/passwd",
-            "'; DROP TABLE devices; --",
-        ],
-        "malicious_inputs": {
-            "device_uuid": [
-                "../../../etc/passwd",
-                "<script>alert('xss')</script>",
-                "'; DROP TABLE devices; --",
-                "device-uuid-1; rm -rf /",
-                {"malicious": "object"},
-                ["array", "input"],
-            ],
-            "service_name": [
-                "../../../bin/bash",
-                "; rm -rf /",
-                "service'; cat /etc/passwd #",
-                "<script>alert('xss')</script>",
-            ],
-            "environment_variables": {
-                "../../../etc/passwd": "malicious_value",
-                "NORMAL_VAR": "'; cat /etc/passwd #",
-                "XSS_VAR": "<script>alert('xss')</script>",
-                "SQL_INJECTION": "'; DROP TABLE devices; --",
-            },
-        },
-        "rate_limit_scenarios": [
-            {"requests_per_second": 10, "duration": 60},
-            {"requests_per_second": 50, "duration": 30},
-            {"requests_per_second": 100, "duration": 10},
-        ],
-    }
+MALICIOUS_DEVICE_UUIDS = (
+    "../../../etc/passwd",
+    "<script>alert('xss')</script>",
+    "'; DROP TABLE devices; --",
+    "device-uuid-1; rm -rf /",
+)
+
+
+@pytest.fixture(params=MALICIOUS_DEVICE_UUIDS)
+def malicious_device_uuid(request):
+    """Each malicious device UUID in turn."""
+    return request.param
 
 
 # Test data validation helpers
+_DEVICE_REQUIRED_FIELDS = frozenset(
+    {"uuid", "device_name", "device_type", "is_online", "status"}
+)
+_FLEET_REQUIRED_FIELDS = frozenset({"id", "app_name", "slug", "device_type"})
+_METRICS_FIELDS = frozenset(
+    {"cpu_usage", "memory_usage", "memory_total", "storage_usage", "storage_total"}
+)
+
+
 def validate_device_data(device_data: Dict[str, Any]) -> bool:
     """Validate device data structure."""
-    required_fields = ["uuid", "device_name", "device_type", "is_online", "status"]
-    return all(field in device_data for field in required_fields)
+    return _DEVICE_REQUIRED_FIELDS <= device_data.keys()
 
 
 def validate_fleet_data(fleet_data: Dict[str, Any]) -> bool:
     """Validate fleet data structure."""
-    required_fields = ["id", "app_name", "slug", "device_type"]
-    return all(field in fleet_data for field in required_fields)
+    return _FLEET_REQUIRED_FIELDS <= fleet_data.keys()
 
 
 def validate_metrics_data(metrics_data: Dict[str, Any]) -> bool:
     """Validate metrics data structure."""
-    expected_fields = ["cpu_usage", "memory_usage", "memory_total", "storage_usage", "storage_total"]
-    return any(field in metrics_data for field in expected_fields)
+    return not _METRICS_FIELDS.isdisjoint(metrics_data)
@@ -249,6 +249,7 @@ class TestBalenaCloudAPIClient:
         assert hasattr(api_client, 'async_validate_token')
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("eager_tasks")
     async def test_concurrent_api_requests(self, api_client):
         """Test concurrent API requests handling."""
         with patch.object(api_client, '_ensure_initialized', autospec=True):
@@ -308,13 +309,18 @@ class TestAPIIntegrationScenarios:
 
         with patch.object(coordinator.api, "async_get_fleets") as mock_get_fleets, \
              patch.object(coordinator.api, "async_get_devices") as mock_get_devices, \
-             patch.object(coordinator.api, "async_get_device_status") as mock_get_status:
+             patch.object(coordinator.api, "async_get_device_status") as mock_get_status, \
+             patch.object(coordinator.api, "async_get_device_url", return_value=None):
+
+            devices = mock_balena_api_response["devices"]
+            devices_by_uuid = {d["uuid"]: d for d in devices}
+            metrics_by_uuid = mock_balena_api_response["device_metrics"]
 
             mock_get_fleets.return_value = mock_balena_api_response["fleets"]
-            mock_get_devices.return_value = mock_balena_api_response["devices"]
+            mock_get_devices.return_value = devices
             mock_get_status.side_effect = lambda uuid: {
-                "device": next((d for d in mock_balena_api_response["devices"] if d["uuid"] == uuid), {}),
-                "metrics": mock_balena_api_response["device_metrics"].get(uuid, {}),
+                "device": devices_by_uuid.get(uuid, {}),
+                "metrics": metrics_by_uuid.get(uuid, {}),
                 "services": []  # Services are now included in device status
             }
 
@@ -352,6 +358,7 @@ class TestAPIIntegrationScenarios:
             data = await coordinator._async_update_data()
             assert len(data["fleets"]) == 1
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_large_dataset_handling(self, coordinator_setup, performance_test_data):
         """Test handling of large datasets."""
@@ -362,7 +369,8 @@ class TestAPIIntegrationScenarios:
 
         with patch.object(coordinator.api, "async_get_fleets") as mock_get_fleets, \
              patch.object(coordinator.api, "async_get_devices") as mock_get_devices, \
-             patch.object(coordinator.api, "async_get_device_status") as mock_get_status:
+             patch.object(coordinator.api, "async_get_device_status") as mock_get_status, \
+             patch.object(coordinator.api, "async_get_device_url", return_value=None):
 
             mock_get_fleets.return_value = performance_test_data["fleets"]
             mock_get_devices.return_value = performance_test_data["devices"]
@@ -436,19 +444,15 @@ class TestAPISecurityValidation:
         assert "sensitive_token_12345" not in client_str or "***" in client_str
 
     @pytest.mark.asyncio
-    async def test_input_sanitization(self, api_client, security_test_scenarios):
+    async def test_input_sanitization(self, api_client, malicious_device_uuid):
         """Test input sanitization for security."""
-        malicious_inputs = security_test_scenarios["malicious_inputs"]
-
-        for malicious_uuid in malicious_inputs["device_uuid"]:
-            if isinstance(malicious_uuid, str):
-                try:
-                    with patch.object(api_client, '_run_in_executor') as mock_executor:
-                        mock_executor.return_value = {}
-                        await api_client.async_get_device(malicious_uuid)
-                except Exception as e:
-                    assert "script" not in str(e).lower()
-                    assert "passwd" not in str(e).lower()
+        try:
+            with patch.object(api_client, '_run_in_executor') as mock_executor:
+                mock_executor.return_value = {}
+                await api_client.async_get_device(malicious_device_uuid)
+        except Exception as e:
+            assert "script" not in str(e).lower()
+            assert "passwd" not in str(e).lower()
 
     @pytest.mark.asyncio
     async def test_request_parameter_validation(self, api_client):
@@ -482,6 +486,7 @@ class TestAPIPerformanceAndReliability:
             request_time = (end_time - start_time).total_seconds()
             assert request_time < API_TIMEOUT
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_memory_usage_with_large_responses(self, api_client, performance_test_data):
         """Test memory usage with large API responses."""
@@ -499,6 +504,7 @@ class TestAPIPerformanceAndReliability:
         assert hasattr(api_client, 'async_get_user_info')
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("eager_tasks")
     async def test_concurrent_request_limit(self, api_client):
         """Test handling of concurrent request limits."""
         with patch.object(api_client, '_ensure_initialized', autospec=True):
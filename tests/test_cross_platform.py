@@ -216,6 +216,7 @@ class TestDeviceCompatibility:
 class TestFleetManagementIntegration:
     """Test fleet management functionality across different scenarios."""
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_large_fleet_handling(self, performance_test_data):
         """Test handling of large fleets with many devices."""
@@ -569,6 +570,7 @@ class TestPerformanceAndScalability:
         # Verify all devices were processed
         assert coordinator.async_restart_application.call_count == 20
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_memory_usage_with_large_datasets(self, performance_test_data):
         """Test memory usage with large device datasets."""
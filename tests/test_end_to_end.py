@@ -661,6 +661,7 @@ class TestRealWorldScenarios:
 class TestPerformanceScenarios:
     """Test performance under various load conditions."""
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_large_fleet_performance(self, performance_test_data):
         """Test performance with large fleet of devices."""
@@ -12,7 +12,12 @@ from custom_components.balena_cloud.api import (
     BalenaCloudAPIError,
     BalenaCloudAuthenticationError,
 )
-from custom_components.balena_cloud.models import BalenaDevice, BalenaFleet, BalenaDeviceMetrics
+from custom_components.balena_cloud.models import (
+    BalenaDevice,
+    BalenaDeviceMetrics,
+    BalenaFleet,
+    assess_device_health,
+)
 from custom_components.balena_cloud.const import DOMAIN, DEFAULT_UPDATE_INTERVAL
 from custom_components.balena_cloud.coordinator import BalenaCloudDataUpdateCoordinator
 from custom_components.balena_cloud.sensor import BalenaCloudSensorEntity, SENSOR_TYPES
@@ -311,22 +316,8 @@ class TestBalenaCloudDataUpdateCoordinatorUnit:
     """Unit tests for BalenaCloudDataUpdateCoordinator."""
 
     @pytest.fixture
-    def mock_coordinator_setup(self):
+    def mock_coordinator_setup(self, mock_hass):
         """Set up mock coordinator for testing."""
-        mock_hass = AsyncMock()
-
-        # Ensure Home Assistant frame helper is set up for DataUpdateCoordinator
-        from homeassistant.helpers import frame as ha_frame
-        import threading, asyncio
-        mock_hass.loop_thread_id = threading.get_ident()
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        mock_hass.loop = loop
-        ha_frame.async_setup(mock_hass)
-
         config_data = {
             "api_token": "test_token_12345",
             "fleets": [1001, 1002],
@@ -466,6 +457,90 @@ class TestBalenaCloudDataUpdateCoordinatorUnit:
         assert result is True
         coordinator.api.async_update_environment_variables.assert_called_once_with("device-uuid-1", env_vars)
 
+    @pytest.mark.asyncio
+    async def test_coordinator_update_urls(self, mock_coordinator_setup):
+        """Test a failed URL lookup keeps the last known URL without retrying."""
+        coordinator, _, _ = mock_coordinator_setup
+
+        urls = {"device-1": "https://device-1.balena-devices.com", "device-2": None}
+
+        def _get_device_url(method_path, device_uuid):
+            if device_uuid == "device-3":
+                raise ConnectionError("Connection reset by peer")
+            return urls[device_uuid]
+
+        coordinator.api = BalenaCloudAPIClient("test_token")
+        coordinator.devices = {
+            "device-1": MagicMock(),
+            "device-2": MagicMock(),
+            "device-3": MagicMock(),
+        }
+        previous_urls = {"device-3": "https://device-3.balena-devices.com"}
+        coordinator.device_urls = previous_urls
+
+        with patch.object(
+            coordinator.api, "_run_in_executor", side_effect=_get_device_url
+        ) as mock_executor:
+            await coordinator._async_update_urls()
+
+        # One attempt per device; the failure is not backed off and retried
+        assert mock_executor.call_count == 3
+        assert coordinator.device_urls == {
+            "device-1": "https://device-1.balena-devices.com",
+            "device-2": None,
+            "device-3": "https://device-3.balena-devices.com",
+        }
+        # The previous dict may be held by coordinator.data and is left as is
+        assert previous_urls == {"device-3": "https://device-3.balena-devices.com"}
+
+    @pytest.mark.asyncio
+    async def test_coordinator_get_device_url_failure(self, mock_coordinator_setup):
+        """Test a failed on-demand URL lookup is retried on the next refresh."""
+        coordinator, _, _ = mock_coordinator_setup
+
+        coordinator.api = AsyncMock()
+        coordinator.api.async_get_device_url.side_effect = BalenaCloudAPIError("API Error")
+        coordinator.api._async_get_device_url.return_value = "https://device-1.balena-devices.com"
+        coordinator.devices = {"device-1": MagicMock()}
+        coordinator.device_urls = {"device-1": None}
+        coordinator._urls_refreshed = datetime.now()
+
+        with pytest.raises(BalenaCloudAPIError):
+            await coordinator.async_get_device_url("device-1")
+        assert "device-1" not in coordinator.device_urls
+
+        await coordinator._async_update_urls()
+        assert coordinator.device_urls == {"device-1": "https://device-1.balena-devices.com"}
+
+    @pytest.mark.asyncio
+    async def test_coordinator_update_urls_cadence(self, mock_coordinator_setup):
+        """Test URLs are only re-checked once per refresh interval."""
+        coordinator, _, _ = mock_coordinator_setup
+
+        coordinator.api = AsyncMock()
+        coordinator.api._async_get_device_url.side_effect = [
+            None,
+            BalenaCloudAPIError("API Error"),
+            None,
+        ]
+        coordinator.devices = {"device-1": MagicMock(), "device-2": MagicMock()}
+
+        await coordinator._async_update_urls()
+        coordinator.devices = {
+            "device-1": MagicMock(),
+            "device-2": MagicMock(),
+            "device-3": MagicMock(),
+        }
+        await coordinator._async_update_urls()
+
+        # The second refresh only looks up the newly seen device; the failed
+        # lookup for device-2 waits for the next full pass
+        assert [
+            call.args[0]
+            for call in coordinator.api._async_get_device_url.call_args_list
+        ] == ["device-1", "device-2", "device-3"]
+        assert coordinator.device_urls == {"device-1": None, "device-3": None}
+
 
 class TestConfigurationFlowUnit:
     """Unit tests for configuration flow."""
@@ -651,6 +726,60 @@ class TestEntityPlatformsUnit:
         await button.async_press()
         assert coordinator.restart_called is True
 
+    def test_button_attributes_follow_device_rename(self, mock_device_with_metrics):
+        """Test button attributes pick up a device renamed in balenaCloud."""
+        from dataclasses import replace
+
+        from custom_components.balena_cloud.button import BalenaCloudButtonEntity, BUTTON_TYPES
+        from custom_components.balena_cloud.const import ATTR_DEVICE_NAME
+
+        coordinator = MagicMock()
+        coordinator.get_device.return_value = mock_device_with_metrics
+        button = BalenaCloudButtonEntity(
+            coordinator=coordinator,
+            description=BUTTON_TYPES[0],
+            device_uuid="test-device-uuid",
+        )
+        assert button.extra_state_attributes[ATTR_DEVICE_NAME] == "Test Device"
+
+        # Each refresh rebuilds the device from the API
+        coordinator.get_device.return_value = replace(
+            mock_device_with_metrics, device_name="Renamed Device"
+        )
+        with patch.object(button, "async_write_ha_state"):
+            button._handle_coordinator_update()
+
+        assert button.extra_state_attributes[ATTR_DEVICE_NAME] == "Renamed Device"
+
+    @pytest.mark.asyncio
+    async def test_switch_optimistic_state_until_fetch(self, mock_device_with_metrics):
+        """Test the public URL switch stays on until the URL fetch finishes."""
+        from custom_components.balena_cloud.switch import BalenaCloudPublicUrlSwitch
+
+        coordinator = MagicMock()
+        coordinator.get_device.return_value = mock_device_with_metrics
+        coordinator.device_urls = {"test-device-uuid": None}
+        coordinator.async_enable_device_url = AsyncMock(return_value=True)
+        coordinator.async_get_device_url = AsyncMock(
+            side_effect=BalenaCloudAPIError("API Error")
+        )
+        # The fetch is awaited directly below instead of as a background task
+        coordinator.entry.async_create_background_task.side_effect = (
+            lambda hass, target, name: target.close()
+        )
+        switch = BalenaCloudPublicUrlSwitch(coordinator, "test-device-uuid")
+        switch.hass = MagicMock()
+
+        with patch.object(switch, "async_write_ha_state"):
+            await switch.async_turn_on()
+            # A refresh before the fetch finishes keeps the switch on
+            switch._handle_coordinator_update()
+            assert switch.is_on is True
+
+            # A failed fetch still ends the optimistic state
+            await switch._async_fetch_url()
+            assert switch.is_on is False
+
     @pytest.mark.asyncio
     async def test_entity_device_info_creation(self, mock_device_with_metrics):
         """Test entity device info creation."""
@@ -812,6 +941,221 @@ class TestEntityPlatformsUnit:
         assert online_cloud_entity.available == True, "Cloud entity should be available when device is online"
 
 
+class TestDeviceHealthUnit:
+    """Unit tests for device health assessment."""
+
+    @pytest.mark.parametrize(
+        ("metrics", "expected"),
+        [
+            ({"cpu_usage": 80}, "healthy"),
+            ({"cpu_usage": 80.1}, "warning"),
+            ({"cpu_usage": 95}, "warning"),
+            ({"cpu_usage": 95.1}, "critical"),
+            ({"memory_usage": 85, "memory_total": 100}, "healthy"),
+            ({"memory_usage": 90, "memory_total": 100}, "warning"),
+            ({"storage_usage": 99, "storage_total": 100}, "critical"),
+            ({"temperature": 76}, "warning"),
+            ({"cpu_usage": 85, "temperature": 90}, "critical"),
+            ({}, "healthy"),
+        ],
+    )
+    def test_assess_device_health_thresholds(self, metrics, expected):
+        """Test device health buckets at and around each threshold."""
+        assert assess_device_health(BalenaDeviceMetrics(**metrics)) == expected
+
+    def test_assess_device_health_without_metrics(self):
+        """Test devices without metrics are reported as unknown."""
+        assert assess_device_health(None) == "unknown"
+
+    def test_fleet_overview_reads_device_health(self):
+        """Test the fleet overview uses the health assessed at refresh time."""
+        from custom_components.balena_cloud.fleet_overview import BalenaFleetOverview
+
+        device = BalenaDevice(
+            uuid="health-device",
+            device_name="Health Device",
+            device_type="raspberrypi4-64",
+            fleet_id=1001,
+            fleet_name="test-fleet",
+            is_online=True,
+            status="Idle",
+            health_status="warning",
+        )
+        overview = BalenaFleetOverview(MagicMock(), 1001)
+
+        assert overview._assess_device_health(device) == {"status": "warning"}
+
+    def test_fleet_overview_statistics_follow_devices(self):
+        """Test statistics are recomputed when the coordinator's devices change."""
+        from custom_components.balena_cloud.fleet_overview import BalenaFleetOverview
+
+        coordinator = MagicMock()
+        coordinator.devices = {}
+        coordinator.get_devices_by_fleet.return_value = []
+        overview = BalenaFleetOverview(coordinator, 1001)
+        assert overview.fleet_statistics["total_devices"] == 0
+
+        # A refresh replaces the devices dict; no listener is attached
+        device = BalenaDevice(
+            uuid="device-1",
+            device_name="Device 1",
+            device_type="raspberrypi4-64",
+            fleet_id=1001,
+            fleet_name="test-fleet",
+            is_online=True,
+            status="Idle",
+        )
+        coordinator.devices = {"device-1": device}
+        coordinator.get_devices_by_fleet.return_value = [device]
+        assert overview.fleet_statistics["total_devices"] == 1
+
+
+class TestServiceHandlerUnit:
+    """Unit tests for the service handler."""
+
+    def test_device_index_follows_coordinator_devices(self):
+        """Test device lookups track registration and coordinator refreshes."""
+        from custom_components.balena_cloud.services import BalenaCloudServiceHandler
+
+        listeners = []
+        unsub = MagicMock()
+        coordinator = MagicMock()
+        coordinator.devices = {"device-1": MagicMock()}
+        coordinator.async_add_listener.side_effect = (
+            lambda update_callback: listeners.append(update_callback) or unsub
+        )
+
+        handler = BalenaCloudServiceHandler(MagicMock())
+        handler.register_coordinator("entry-1", coordinator)
+        assert handler.get_coordinator_for_device("device-1") is coordinator
+        assert handler.get_coordinator_for_device("device-2") is None
+
+        # A refresh that swaps devices re-indexes the coordinator
+        coordinator.devices = {"device-2": MagicMock()}
+        listeners[0]()
+        assert handler.get_coordinator_for_device("device-1") is None
+        assert handler.get_coordinator_for_device("device-2") is coordinator
+
+        handler.unregister_coordinator("entry-1")
+        unsub.assert_called_once()
+        assert handler.get_coordinator_for_device("device-2") is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_restart_targets_online_fleet_devices(self):
+        """Test bulk restart only restarts confirmed, online fleet devices."""
+        from custom_components.balena_cloud.services import BalenaCloudServiceHandler
+
+        devices = [
+            BalenaDevice(
+                uuid=f"bulk-device-{i}",
+                device_name=f"Bulk Device {i}",
+                device_type="raspberrypi4-64",
+                fleet_id=1001,
+                fleet_name="bulk-fleet",
+                is_online=i != 2,
+                status="Idle",
+            )
+            for i in range(4)
+        ]
+        coordinator = MagicMock()
+        coordinator.devices = {device.uuid: device for device in devices}
+        coordinator.get_devices_by_fleet.return_value = devices
+        coordinator.async_restart_application = AsyncMock(return_value=True)
+
+        handler = BalenaCloudServiceHandler(MagicMock())
+        handler.register_coordinator("entry-1", coordinator)
+
+        await handler._handle_bulk_restart(MagicMock(data={"fleet_id": 1001}))
+        coordinator.async_restart_application.assert_not_called()
+
+        await handler._handle_bulk_restart(
+            MagicMock(data={"fleet_id": 1001, "service_name": "main", "confirm": True})
+        )
+        restarted = {
+            call.args for call in coordinator.async_restart_application.call_args_list
+        }
+        assert restarted == {
+            ("bulk-device-0", "main"),
+            ("bulk-device-1", "main"),
+            ("bulk-device-3", "main"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_restart_fleet_uses_single_fleet_call(self):
+        """Test a full fleet restart is one fleet-level call, not one per device."""
+        from custom_components.balena_cloud.services import BalenaCloudServiceHandler
+
+        devices = [MagicMock(uuid=f"fleet-device-{i}", is_online=True) for i in range(3)]
+        coordinator = MagicMock()
+        coordinator.devices = {}
+        coordinator.get_devices_by_fleet.return_value = devices
+        coordinator.async_restart_fleet = AsyncMock(return_value=True)
+        coordinator.async_restart_application = AsyncMock(return_value=True)
+
+        handler = BalenaCloudServiceHandler(MagicMock())
+        handler.register_coordinator("entry-1", coordinator)
+
+        await handler._handle_restart_fleet(
+            MagicMock(data={"fleet_id": 1001, "confirm": True})
+        )
+        coordinator.async_restart_fleet.assert_awaited_once_with(1001)
+        coordinator.async_restart_application.assert_not_called()
+
+        # Restarting a single service falls back to per-device calls
+        await handler._handle_restart_fleet(
+            MagicMock(data={"fleet_id": 1001, "service_name": "main", "confirm": True})
+        )
+        assert coordinator.async_restart_application.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_fleet_health_fires_summary_event(self):
+        """Test fleet health buckets devices and fires the response event."""
+        from custom_components.balena_cloud.const import EVENT_FLEET_HEALTH_RESPONSE
+        from custom_components.balena_cloud.services import BalenaCloudServiceHandler
+
+        devices = [
+            BalenaDevice(
+                uuid=f"health-device-{health}",
+                device_name=f"Health Device {health}",
+                device_type="raspberrypi4-64",
+                fleet_id=1001,
+                fleet_name="health-fleet",
+                is_online=online,
+                status="Idle",
+                health_status=health,
+            )
+            for health, online in (
+                ("healthy", True),
+                ("unknown", True),
+                ("warning", True),
+                ("critical", True),
+                ("healthy", False),
+            )
+        ]
+        coordinator = MagicMock()
+        coordinator.devices = {}
+        coordinator.get_fleet.return_value = BalenaFleet(
+            id=1001, app_name="health-fleet", slug="org/health-fleet", device_type="raspberrypi4-64"
+        )
+        coordinator.get_devices_by_fleet.return_value = devices
+
+        hass = MagicMock()
+        handler = BalenaCloudServiceHandler(hass)
+        handler.register_coordinator("entry-1", coordinator)
+
+        await handler._handle_get_fleet_health(MagicMock(data={"fleet_id": 1001}))
+
+        event_type, health_data = hass.bus.async_fire.call_args.args
+        assert event_type == EVENT_FLEET_HEALTH_RESPONSE
+        assert health_data["fleet_name"] == "health-fleet"
+        assert health_data["total_devices"] == 5
+        assert health_data["online_devices"] == 4
+        assert health_data["healthy_devices"] == 2
+        assert health_data["warning_devices"] == 1
+        assert health_data["critical_devices"] == 2
+        assert len(health_data["device_details"]) == 5
+
+
 class TestUtilityFunctionsUnit:
     """Unit tests for utility functions."""
 